@@ -1,17 +1,15 @@
 import os
 from email.policy import default
 
-import requests
+from component import api_client
 import streamlit as st
-from component.local_store import LocalStorageManager
+from component.auth_session import start_session
+from component.prefetch import start_prefetch
 from component.nav import login_nav
 from dotenv import load_dotenv
 load_dotenv()
 
 
-# Local storage for login status
-storage = LocalStorageManager("user_login_status")
-
 # Backend API
 API_BASE_URL = os.getenv('API_BASE_URL')
 LOGIN_URL = f"{API_BASE_URL}/auth/login"
@@ -45,7 +43,7 @@ if st.session_state.show_register:
         if password != confirm_password:
             st.warning("⚠️ Passwords do not match.")
         else:
-            res = requests.post(REGISTER_URL, json={
+            res = api_client.post(REGISTER_URL, json={
                 "name": username,
                 "email": email,
                 "password": password,
@@ -66,12 +64,12 @@ else:
         login_btn = st.form_submit_button("Login",use_container_width=20)
 
     if login_btn:
-        res = requests.post(LOGIN_URL, json={"email": email, "password": password})
+        res = api_client.post(LOGIN_URL, json={"email": email, "password": password})
         if res.status_code == 200:
-            data = res.json()
-            st.session_state.username = data.get("username", "")
-            st.session_state.user_id = data.get("id", "")
-            storage.set_item("login_status", True)
+            # Keeps the backend token and profile in the server-side session cache
+            start_session(res.json())
+            # Warm the shared caches while the dashboard loads
+            start_prefetch()
             st.success("✅ Login successful! Redirecting...")
 
             main = st.Page("main.py", title="main")
@@ -0,0 +1,131 @@
+import os
+import time
+from typing import Any
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from component import fetch_tracer
+from component.metrics import get_metrics
+
+load_dotenv()
+
+API_BASE_URL = os.getenv('API_BASE_URL')
+
+# Pool / timeout / retry settings (override from .env)
+POOL_SIZE = int(os.getenv('API_POOL_SIZE', 20))
+CONNECT_TIMEOUT = float(os.getenv('API_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.getenv('API_READ_TIMEOUT', 30))
+MAX_RETRIES = int(os.getenv('API_MAX_RETRIES', 3))
+BACKOFF_FACTOR = float(os.getenv('API_BACKOFF_FACTOR', 0.3))
+
+# Only verbs that are safe to replay are retried
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS = (502, 503, 504)
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Returns the keep-alive session shared by every page of this server."""
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS,
+        allowed_methods=IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Accept": "application/json"})
+    return session
+
+
+def build_url(path: str) -> str:
+    """Accepts an absolute URL or a path relative to API_BASE_URL."""
+    if path.startswith(("http://", "https://")):
+        return path
+    return f"{API_BASE_URL}/{path.lstrip('/')}"
+
+
+def request(method: str, path: str, **kwargs: Any) -> requests.Response:
+    """Sends a request through the pooled session with the default timeouts."""
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    url = build_url(path)
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.RequestException:
+        # Connection errors and timeouts are recorded as status 0
+        get_metrics().record_request(method, url, (time.perf_counter() - start) * 1000, 0, 0)
+        fetch_tracer.record(method, url, (time.perf_counter() - start) * 1000, None)
+        raise
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    get_metrics().record_request(method, url, elapsed_ms, response.status_code, len(response.content))
+    fetch_tracer.record(method, url, elapsed_ms, response)
+    return response
+
+
+def is_success(response: requests.Response) -> bool:
+    return 200 <= response.status_code < 300
+
+
+def get(path: str, **kwargs: Any) -> requests.Response:
+    return request("GET", path, **kwargs)
+
+
+def post(path: str, **kwargs: Any) -> requests.Response:
+    return request("POST", path, **kwargs)
+
+
+def put(path: str, **kwargs: Any) -> requests.Response:
+    return request("PUT", path, **kwargs)
+
+
+def delete(path: str, **kwargs: Any) -> requests.Response:
+    return request("DELETE", path, **kwargs)
+
+
+@st.cache_resource
+def _validators() -> dict:
+    """(url, params) -> (ETag, parsed body) of the last full response, for conditional GETs."""
+    return {}
+
+
+def revalidate(path: str, params: dict = None) -> tuple:
+    """GETs a collection with If-None-Match; returns (body, not_modified).
+
+    A 304 reuses the body stored for the last ETag, so an unchanged collection
+    costs one empty response instead of the full payload. Only the latest
+    parameterised (delta) query is remembered per URL.
+    """
+    url = build_url(path)
+    key = (url, tuple(sorted((params or {}).items())))
+    validators = _validators()
+    cached = validators.get(key)
+    response = get(url, params=params, headers={"If-None-Match": cached[0]} if cached else None)
+    if response.status_code == 304 and cached:
+        fetch_tracer.mark_used(response)
+        return cached[1], True
+    response.raise_for_status()
+    body = response.json()
+    etag = response.headers.get("ETag")
+    if params:
+        for stale in [k for k in list(validators) if k[0] == url and k[1] and k != key]:
+            validators.pop(stale, None)
+    if etag:
+        validators[key] = (etag, body)
+    else:
+        validators.pop(key, None)
+    return body, False
+
+
+def get_json(path: str) -> Any:
+    """Conditional GET returning the parsed body (fresh or revalidated)."""
+    return revalidate(path)[0]
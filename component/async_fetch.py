@@ -0,0 +1,91 @@
+import asyncio
+import copy
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from typing import Any
+
+import streamlit as st
+from component import api_client
+from component.concurrency import with_script_ctx
+
+# Completed GETs are reused for this many seconds, so a burst of reruns costs one request
+RESULT_HOLD = float(os.getenv('ASYNC_FETCH_HOLD', 2))
+# How often a waiting script yields to Streamlit to notice a newer rerun
+POLL_INTERVAL = 0.1
+
+
+class AsyncFetcher:
+    """GETs run on one asyncio loop in a background thread.
+
+    Identical in-flight GETs share a single request; when every waiter for a
+    request has gone (its rerun was superseded), its result is discarded. The
+    HTTP call itself runs on a worker thread and still completes. Each caller
+    gets its own copy of the result, since callers may keep and mutate it.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="async-fetch", daemon=True).start()
+        # Only touched from the loop thread
+        self._inflight = {}
+        self._recent = {}
+
+    async def _fetch(self, get, path: str, params: dict) -> Any:
+        response = await asyncio.to_thread(get, path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def _join(self, key: tuple, get, path: str, params: dict) -> Any:
+        recent = self._recent.get(key)
+        if recent and time.monotonic() - recent[0] < RESULT_HOLD:
+            return copy.deepcopy(recent[1])
+
+        entry = self._inflight.get(key)
+        if entry is None:
+            entry = self._inflight[key] = {"task": asyncio.ensure_future(self._fetch(get, path, params)), "waiters": 0}
+        entry["waiters"] += 1
+        try:
+            result = await asyncio.shield(entry["task"])
+            now = time.monotonic()
+            self._recent = {k: v for k, v in self._recent.items() if now - v[0] < RESULT_HOLD}
+            self._recent[key] = (now, result)
+            return copy.deepcopy(result)
+        finally:
+            entry["waiters"] -= 1
+            if self._inflight.get(key) is entry and (entry["task"].done() or not entry["waiters"]):
+                self._inflight.pop(key)
+                # Nobody is waiting any more: the request was superseded, drop its result
+                entry["task"].cancel()
+
+    def submit(self, path: str, params: dict = None) -> Future:
+        key = (api_client.build_url(path), tuple(sorted((params or {}).items())))
+        get = with_script_ctx(api_client.get)
+        return asyncio.run_coroutine_threadsafe(self._join(key, get, path, params), self.loop)
+
+
+@st.cache_resource
+def get_async_fetcher() -> AsyncFetcher:
+    return AsyncFetcher()
+
+
+def fetch_json(path: str, params: dict = None) -> Any:
+    """GETs and parses JSON, sharing the request with identical concurrent calls.
+
+    While waiting, the script keeps yielding to Streamlit; if a newer rerun
+    supersedes this one, our wait is cancelled and, if no one else needs it, the
+    result is discarded. HTTP errors are raised as ``requests.HTTPError``.
+    """
+    future = get_async_fetcher().submit(path, params)
+    placeholder = st.empty()
+    try:
+        while True:
+            try:
+                return future.result(timeout=POLL_INTERVAL)
+            except TimeoutError:
+                # Emitting an element is where Streamlit stops a superseded run
+                placeholder.empty()
+    except BaseException:
+        future.cancel()
+        raise
@@ -0,0 +1,121 @@
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import streamlit as st
+from component.local_store import LocalStorageManager, session_key
+
+# Active sessions kept in memory (least recently used are evicted first)
+MAX_SESSIONS = int(os.getenv('AUTH_MAX_SESSIONS', 500))
+# Seconds without a rerun before a session is dropped
+IDLE_TIMEOUT = float(os.getenv('AUTH_IDLE_TIMEOUT', 1800))
+# Absolute session lifetime in seconds, whatever the activity
+SESSION_TTL = float(os.getenv('AUTH_SESSION_TTL', 12 * 3600))
+
+
+class SessionCache:
+    """Server-side LRU of logged-in sessions: token -> profile, with idle and absolute expiry."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, idle_timeout: float = IDLE_TIMEOUT, ttl: float = SESSION_TTL):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        # Oldest activity is at the front; stop at the first session that is still fresh
+        while self._sessions:
+            token, session = next(iter(self._sessions.items()))
+            if len(self._sessions) > self.max_sessions or now - session["last_seen"] > self.idle_timeout:
+                self._sessions.pop(token)
+            else:
+                break
+
+    def create(self, token: str, profile: dict, browser: str = "") -> dict:
+        now = time.monotonic()
+        session = {"token": token, "profile": profile, "browser": browser, "created": now, "last_seen": now}
+        with self._lock:
+            self._sessions[token] = session
+            self._sessions.move_to_end(token)
+            self._evict(now)
+        return session
+
+    def get(self, token: str) -> Optional[dict]:
+        """Returns the live session for token (and marks it active), or None if unknown or expired."""
+        if not token:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            if now - session["last_seen"] > self.idle_timeout or now - session["created"] > self.ttl:
+                self._sessions.pop(token)
+                return None
+            session["last_seen"] = now
+            self._sessions.move_to_end(token)
+            self._evict(now)
+            return session
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+@st.cache_resource
+def get_session_cache() -> SessionCache:
+    return SessionCache()
+
+
+def _storage() -> LocalStorageManager:
+    return LocalStorageManager("user_login_status")
+
+
+def _apply_profile(profile: dict) -> None:
+    st.session_state.username = profile.get("username", "")
+    st.session_state.user_id = profile.get("id", "")
+    st.session_state.role = profile.get("role", "")
+
+
+def start_session(login_response: dict) -> dict:
+    """Stores the backend token and user profile for this browser session after a successful login."""
+    token = login_response.get("access_token") or login_response.get("token") or secrets.token_urlsafe(32)
+    profile = {key: value for key, value in login_response.items() if key not in ("access_token", "token", "password")}
+    session = get_session_cache().create(token, profile, browser=session_key())
+
+    st.session_state.auth_token = token
+    _storage().set_item("auth_token", token)
+    _apply_profile(profile)
+    return session
+
+
+def current_session() -> Optional[dict]:
+    """Validates this browser's session in memory; returns None when logged out or expired.
+
+    A session is only honoured in the browser it was started in, whatever token is presented.
+    """
+    token = st.session_state.get("auth_token")
+    if token is None:
+        # New script session (e.g. a refresh): recover the token kept for this browser
+        token = st.session_state.auth_token = _storage().get_item("auth_token") or ""
+    session = get_session_cache().get(token)
+    if session is None or session["browser"] != session_key():
+        st.session_state.auth_token = ""
+        return None
+    _apply_profile(session["profile"])
+    return session
+
+
+def end_session() -> None:
+    token = st.session_state.get("auth_token")
+    if token:
+        get_session_cache().discard(token)
+    st.session_state.auth_token = ""
+    _storage().set_item("auth_token", None)
@@ -0,0 +1,74 @@
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Hashable, Iterable
+
+import requests
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Upper bound for fan-out so one page can't flood the backend
+MAX_WORKERS = int(os.getenv('API_MAX_WORKERS', 8))
+ROW_RETRIES = int(os.getenv('API_ROW_RETRIES', 2))
+
+
+def with_script_ctx(func: Callable) -> Callable:
+    """Binds func to the calling script run, so Streamlit caches used from a worker thread don't warn.
+
+    The caller's context variables (e.g. the fetch tracer's call list) are carried over too.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        # A context can only be entered by one thread at a time, so each call gets its own copy
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+def map_concurrent(func: Callable[[Any], Any], items: Iterable[Hashable], max_workers: int = MAX_WORKERS) -> dict:
+    """Runs func(item) on a bounded thread pool and returns {item: result or the raised Exception}."""
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        func = with_script_ctx(func)
+        futures = {pool.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                results[item] = e
+    return results
+
+
+def is_transient(response: requests.Response) -> bool:
+    """A 5xx answer may succeed on a retry; any other status is final."""
+    return response.status_code >= 500
+
+
+def with_retries(func: Callable[[], Any], should_retry: Callable[[Any], bool] = is_transient,
+                 retries: int = ROW_RETRIES, backoff: float = 0.5) -> Any:
+    """Calls func() again while should_retry(result) or the connection fails; returns the last result.
+
+    Other errors (e.g. a read timeout, when the server may already have acted) are raised at once.
+    """
+    for attempt in range(retries + 1):
+        try:
+            result = func()
+        except requests.ConnectionError:
+            if attempt == retries:
+                raise
+        else:
+            if attempt == retries or not should_retry(result):
+                return result
+        time.sleep(backoff * (2 ** attempt))
@@ -0,0 +1,57 @@
+import os
+
+import streamlit as st
+from dotenv import load_dotenv
+from component import metrics
+from component.delta_store import get_customer_store, get_order_store
+from component.parameter_catalog import load_parameter_catalog
+from component.parameter_tree import render_parameter_tree, render_parameter_row
+
+load_dotenv()
+
+API_BASE_URL = os.getenv('API_BASE_URL')
+QUOTATION_API = f"{API_BASE_URL}/quotations/"
+
+
+# Joined rows are rebuilt only when either snapshot changed (shared, treat as read-only)
+@metrics.cached("customer_order_join", st.cache_resource(max_entries=2))
+def join_customers_with_orders(customer_revision, order_revision, _customers, _orders):
+    order_map = {order['customer_id']: order for order in _orders}
+    joined = []
+    for customer in _customers:
+        order = order_map.get(customer.get("id"), {})
+        joined.append({
+            **customer,
+            "gst": customer.get("gst") or customer.get("gst_number") or "Not Found",
+            "o_number": order.get("order_number", "No Order Number"),
+            "order_req_comment": order.get("order_req_comment", "No comment"),
+            "order_req_doc": order.get("order_req_doc", "No document")
+        })
+    return joined
+
+
+# ✅ Served from in-memory snapshots, re-synced at most every SYNC_INTERVAL; the join is only
+# rebuilt when a sync actually changed customers or orders
+def fetch_customers_with_orders():
+    try:
+        customer_store = get_customer_store()
+        order_store = get_order_store()
+        customers = customer_store.values()
+        orders = order_store.values()
+        return join_customers_with_orders(customer_store.revision, order_store.revision, customers, orders)
+    except Exception as e:
+        st.error(f"⚠️ Error: {e}")
+        return []
+
+
+# ✅ Tree renderer driven by the catalog's children index (lazy subtrees)
+def render_parameters(parent_id=None, level=0):
+    render_parameter_tree(load_parameter_catalog(), parent_id, level)
+
+
+# ✅ Ranked search over the catalog's prebuilt name index
+def render_filtered_parameters(search_term=None):
+    if search_term is None:
+        search_term = st.session_state.search_term
+    for p in load_parameter_catalog().search(search_term, priced_only=True):
+        render_parameter_row(p, qty_label="Qty for")
@@ -0,0 +1,184 @@
+import heapq
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+
+import streamlit as st
+from component import metrics
+from component.delta_store import get_customer_store
+
+SEARCH_LIMIT = 200
+MEMO_SIZE = 256
+# Queries up to this long take their starts-with hits from precomputed lists
+SHORT_PREFIX = 2
+
+_TOKEN_RE = re.compile(r"[\w@.+-]+")
+SEARCH_FIELDS = ("name", "email", "c_name")
+
+
+def _normalize(text) -> str:
+    return " ".join(str(text or "").lower().split())
+
+
+def _digits(text) -> str:
+    return re.sub(r"\D", "", str(text or ""))
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CustomerSearchIndex:
+    """Normalized-field, token and exact-match (phone/GST/email) index over customers.
+
+    Results are ranked exact id match > exact field > field starts-with >
+    token prefix > substring, then by the customer's position in the list.
+    Posting lists are kept in position order so a limited search can stop
+    early instead of sorting every hit. Null fields index as empty strings,
+    so a missing c_name can't crash a search.
+    """
+
+    def __init__(self, customers: list):
+        self.order = [c["id"] for c in customers]
+        self.position = {cid: pos for pos, cid in enumerate(self.order)}
+
+        self.exact = {}
+        values = []
+        self.token_postings = {}
+        # Short field prefix -> ids in position order (a one-letter query matches thousands)
+        self.short_prefixes = {}
+        for pos, c in enumerate(customers):
+            cid = c["id"]
+            for value in (_digits(c.get("phone_number")), _digits(c.get("whatsapp_number"))):
+                if len(value) >= 6:
+                    self.exact.setdefault(value, []).append(cid)
+            for value in (_normalize(c.get("gst_number") or c.get("gst")), _normalize(c.get("email"))):
+                if value:
+                    self.exact.setdefault(value, []).append(cid)
+
+            tokens, prefixes = set(), set()
+            for field in SEARCH_FIELDS:
+                value = _normalize(c.get(field))
+                if value:
+                    values.append((value, pos, cid))
+                    tokens.update(_TOKEN_RE.findall(value))
+                    prefixes.update(value[:n] for n in range(1, SHORT_PREFIX + 1))
+            for token in tokens:
+                self.token_postings.setdefault(token, []).append(cid)
+            for prefix in prefixes:
+                self.short_prefixes.setdefault(prefix, []).append(cid)
+
+        self.values = sorted(values)
+        self.value_keys = [v[0] for v in self.values]
+        self.vocabulary = sorted(self.token_postings)
+
+        # trigram -> vocabulary tokens, for substring queries
+        self.token_trigrams = {}
+        for token in self.vocabulary:
+            for trigram in _trigrams(token):
+                self.token_trigrams.setdefault(trigram, []).append(token)
+
+        self._memo = OrderedDict()
+
+    def _vocab_prefix(self, prefix: str) -> list:
+        start = bisect_left(self.vocabulary, prefix)
+        end = bisect_left(self.vocabulary, prefix + "￿")
+        return self.vocabulary[start:end]
+
+    def _by_position(self, ids) -> list:
+        return sorted(set(ids), key=self.position.__getitem__)
+
+    def _field_matches(self, query: str) -> tuple:
+        """(exact_ids, starts_with_ids) from a binary search over the sorted field values."""
+        exact, starts = [], []
+        i = bisect_left(self.value_keys, query)
+        if len(query) <= SHORT_PREFIX:
+            # Starts-with hits (exact ones included, take() skips repeats) are already in position order
+            while i < len(self.values) and self.value_keys[i] == query:
+                exact.append(self.values[i][2])
+                i += 1
+            return self._by_position(exact), self.short_prefixes.get(query, [])
+        while i < len(self.values) and self.value_keys[i].startswith(query):
+            value, _, cid = self.values[i]
+            (exact if value == query else starts).append(cid)
+            i += 1
+        return self._by_position(exact), self._by_position(starts)
+
+    def _token_prefix_matches(self, tokens: list):
+        if len(tokens) == 1:
+            postings = [self.token_postings[t] for t in self._vocab_prefix(tokens[0])]
+            return heapq.merge(*postings, key=self.position.__getitem__)
+        matches = None
+        for token in tokens:
+            ids = set()
+            for t in self._vocab_prefix(token):
+                ids.update(self.token_postings[t])
+            matches = ids if matches is None else matches & ids
+        return self._by_position(matches or ())
+
+    def _substring_matches(self, token: str) -> list:
+        if len(token) < 3:
+            hits = [t for t in self.vocabulary if token in t]
+        else:
+            candidate_lists = [self.token_trigrams.get(t, []) for t in _trigrams(token)]
+            smallest = min(candidate_lists, key=len)
+            hits = [t for t in smallest if token in t]
+        ids = set()
+        for t in hits:
+            ids.update(self.token_postings[t])
+        return self._by_position(ids)
+
+    def _search(self, query: str, limit: int) -> list:
+        results, seen = [], set()
+
+        def take(ids) -> bool:
+            for cid in ids:
+                if cid not in seen:
+                    seen.add(cid)
+                    results.append(cid)
+                    if limit and len(results) >= limit:
+                        return True
+            return False
+
+        digits = _digits(query)
+        if take(self._by_position(self.exact.get(query, []) + (self.exact.get(digits, []) if len(digits) >= 6 else []))):
+            return results
+
+        exact, starts = self._field_matches(query)
+        if take(exact) or take(starts):
+            return results
+
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens or take(self._token_prefix_matches(tokens)):
+            return results
+        if len(tokens) == 1:
+            take(self._substring_matches(tokens[0]))
+        return results
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list:
+        """Returns matching customer ids, best first; an empty query returns all ids in list order."""
+        query = _normalize(query)
+        if not query:
+            return self.order[:limit] if limit else list(self.order)
+
+        key = (query, limit)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        results = self._search(query, limit)
+        self._memo[key] = results
+        if len(self._memo) > MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return results
+
+
+@metrics.cached("customer_search_index", st.cache_resource(max_entries=2))
+def _build_index(revision: int, _customers: list) -> CustomerSearchIndex:
+    return CustomerSearchIndex(_customers)
+
+
+def get_customer_search_index() -> CustomerSearchIndex:
+    """Index over the customer snapshot, rebuilt only when the snapshot revision changes."""
+    store = get_customer_store()
+    customers = store.values()
+    return _build_index(store.revision, customers)
@@ -0,0 +1,187 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import streamlit as st
+from component import api_client
+from component.concurrency import with_script_ctx
+from component import metrics
+from component.delta_store import get_customer_store, get_order_store, get_parameter_store, get_sample_store
+
+CACHE_TTL = 600
+# Wall-clock budget per collection when several are fetched together
+DEFAULT_FETCH_TIMEOUT = float(os.getenv('API_FETCH_TIMEOUT', 20))
+
+
+def _get_json(path: str):
+    response = api_client.get(path)
+    response.raise_for_status()
+    return response.json()
+
+
+# --- Collection registry: each cached read is keyed by its collection's version ---
+COLLECTION_PATHS = {
+    "customers": "/customer_request/",
+    "orders": "/order/",
+    "quotations": "/quotations/",
+    "parameters": "/parameter/",
+    "samples": "/samples/get_sample",
+    "order_parameters": "/order_parameters/",
+}
+
+
+@metrics.cached("collections", st.cache_data(show_spinner=False, ttl=CACHE_TTL, max_entries=32))
+def _fetch_collection(name: str, version: int) -> list:
+    # Conditional GET: after the TTL an unchanged collection is a 304, not a full payload
+    return api_client.get_json(COLLECTION_PATHS[name])
+
+
+def fetch_collection(name: str) -> list:
+    """Cached list for one collection; errors are raised, never cached.
+
+    Invalidating a collection bumps only its version, so other collections stay cached.
+    """
+    return _fetch_collection(name, data_version(name)[0])
+
+
+def fetch_orders() -> list:
+    return fetch_collection("orders")
+
+
+def fetch_customers() -> list:
+    return fetch_collection("customers")
+
+
+def fetch_quotations() -> list:
+    return fetch_collection("quotations")
+
+
+def fetch_order_parameters() -> list:
+    return fetch_collection("order_parameters")
+
+
+def fetch_parameters() -> list:
+    return fetch_collection("parameters")
+
+
+def fetch_samples() -> list:
+    return fetch_collection("samples")
+
+
+COLLECTIONS = {
+    "customers": fetch_customers,
+    "orders": fetch_orders,
+    "quotations": fetch_quotations,
+    "parameters": fetch_parameters,
+    "samples": fetch_samples,
+    "order_parameters": fetch_order_parameters,
+}
+# order_parameters is by far the largest payload
+COLLECTION_TIMEOUTS = {"order_parameters": DEFAULT_FETCH_TIMEOUT * 2}
+
+
+def fetch_collections(names: list) -> tuple:
+    """Fetches several cached collections concurrently.
+
+    Returns (data, errors): one dict of collection -> list for everything that
+    loaded, and one of collection -> message for what failed or timed out.
+    """
+    data, errors = {}, {}
+    if not names:
+        return data, errors
+
+    start = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=len(names))
+    futures = {name: pool.submit(with_script_ctx(COLLECTIONS[name])) for name in names}
+    for name, future in futures.items():
+        budget = COLLECTION_TIMEOUTS.get(name, DEFAULT_FETCH_TIMEOUT)
+        try:
+            data[name] = future.result(timeout=max(0.0, start + budget - time.monotonic()))
+        except TimeoutError:
+            errors[name] = f"timed out after {budget:.0f}s"
+        except Exception as e:
+            errors[name] = str(e)
+    pool.shutdown(wait=False, cancel_futures=True)
+    return data, errors
+
+
+# --- Per-id lookups (only used when a bulk list misses a record) ---
+def fetch_order_by_id(order_id) -> dict:
+    return _get_json(f"/order/order_id/{order_id}")
+
+
+def fetch_customer_by_id(customer_id) -> dict:
+    return _get_json(f"/customer_request/{customer_id}")
+
+
+# --- Per-order detail (quotation + order_parameters), versioned per order id ---
+@st.cache_resource
+def _order_detail_versions() -> dict:
+    return {}
+
+
+@metrics.cached("order_detail", st.cache_data(show_spinner=False, ttl=CACHE_TTL))
+def _fetch_order_detail(order_id, version: int) -> tuple:
+    response = api_client.get(f"/quotations/{order_id}")
+    if response.status_code == 404:
+        return None, []
+    response.raise_for_status()
+    quotation = response.json()
+    if not quotation:
+        return None, []
+    return quotation, _get_json(f"/order_parameters/op_id/{quotation['id']}")
+
+
+def fetch_order_detail(order_id) -> tuple:
+    """Returns (quotation, order_parameters) for one order, cached until that order is invalidated."""
+    return _fetch_order_detail(order_id, _order_detail_versions().get(order_id, 0))
+
+
+# --- Data versions (derived caches such as order_facts key on these) ---
+@st.cache_resource
+def _collection_versions() -> dict:
+    return {}
+
+
+def data_version(*names) -> tuple:
+    versions = _collection_versions()
+    return tuple(versions.get(name, 0) for name in names)
+
+
+def _bump(*names) -> None:
+    versions = _collection_versions()
+    for name in names:
+        versions[name] = versions.get(name, 0) + 1
+
+
+# --- Invalidation ---
+def invalidate_orders() -> None:
+    """Call after an order or quotation is created; the order snapshot reconciles in the background."""
+    get_order_store().refresh_in_background()
+    _bump("orders")
+
+
+def invalidate_customers() -> None:
+    get_customer_store().refresh_in_background()
+    _bump("customers")
+
+
+def invalidate_parameters() -> None:
+    get_parameter_store().refresh_in_background()
+    _bump("parameters")
+
+
+def invalidate_samples() -> None:
+    get_sample_store().refresh_in_background()
+    _bump("samples")
+
+
+def invalidate_quotations() -> None:
+    """Call after a quotation (and its order_parameters) is created or deleted."""
+    _bump("quotations", "order_parameters")
+
+
+def invalidate_order_detail(order_id) -> None:
+    """Drops only this order's cached quotation/order_parameters (e.g. after saving results)."""
+    versions = _order_detail_versions()
+    versions[order_id] = versions.get(order_id, 0) + 1
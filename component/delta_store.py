@@ -0,0 +1,202 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from component import api_client
+from component.concurrency import with_script_ctx
+from component.metrics import get_metrics
+
+# Seconds between delta syncs (reruns inside this window are served from memory)
+SYNC_INTERVAL = float(os.getenv('DELTA_SYNC_INTERVAL', 30))
+# Seconds between full snapshots, which also drop records deleted upstream
+FULL_SYNC_INTERVAL = float(os.getenv('DELTA_FULL_SYNC_INTERVAL', 600))
+
+# Reconciles stores after local mutations, off the script thread
+_BACKGROUND = ThreadPoolExecutor(max_workers=2, thread_name_prefix="delta-sync")
+
+
+class DeltaStore:
+    """In-memory snapshot of one collection that only pulls records changed since a watermark.
+
+    The watermark is the newest ``updated_at`` seen (sent as ``updated_since``);
+    collections without that field fall back to the highest id (sent as
+    ``after_id``). A backend that ignores the parameter returns records older
+    than the watermark; the store then stops sending deltas and diffs each
+    (ETag-revalidated) full list against its snapshot locally instead.
+    """
+
+    def __init__(self, path: str, watermark_field: str = "updated_at"):
+        self.path = path
+        self.watermark_field = watermark_field
+        self.records = {}
+        self.revision = 0
+        self.watermark = None
+        self.uses_ids = False
+        self.deltas_supported = True
+        self.last_sync = 0.0
+        self.last_full_sync = 0.0
+        self.last_error = None
+        self._pending = None
+        self._lock = threading.Lock()
+
+    def _delta_params(self) -> dict:
+        if self.watermark is None:
+            return {}
+        return {"after_id": self.watermark} if self.uses_ids else {"updated_since": self.watermark}
+
+    def _ignored_delta(self, changed: list) -> bool:
+        """True if the backend sent records older than the watermark, i.e. the full list."""
+        key = "id" if self.uses_ids else self.watermark_field
+        return any(r.get(key) is not None and r[key] < self.watermark for r in changed)
+
+    def _advance_watermark(self, changed: list) -> None:
+        if not changed:
+            return
+        if self.watermark is None:
+            self.uses_ids = not any(r.get(self.watermark_field) for r in changed)
+        key = "id" if self.uses_ids else self.watermark_field
+        marks = [r[key] for r in changed if r.get(key) is not None]
+        if marks:
+            self.watermark = max([self.watermark, *marks]) if self.watermark is not None else max(marks)
+
+    def _merge(self, changed: list, full: bool) -> None:
+        records = {} if full else dict(self.records)
+        for record in changed:
+            if record.get("is_delete"):
+                records.pop(record["id"], None)
+            else:
+                records[record["id"]] = record
+        # Caches key on the revision, so it only moves when a record actually changed;
+        # swap in one assignment so readers never see a half-merged dict
+        if records != self.records:
+            self.records = records
+            self.revision += 1
+
+    def sync(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.last_sync < SYNC_INTERVAL:
+            get_metrics().record_cache(f"store {self.path}", hit=True)
+            return
+        with self._lock:
+            if not force and now - self.last_sync < SYNC_INTERVAL:
+                return
+            full = (not self.deltas_supported or self.watermark is None
+                    or now - self.last_full_sync >= FULL_SYNC_INTERVAL)
+            if not force:
+                get_metrics().record_cache(f"store {self.path}", hit=False)
+            # Snapshots and deltas revalidate with the last ETag; a 304 keeps the records as they are
+            changed, not_modified = api_client.revalidate(self.path, params=None if full else self._delta_params())
+            if not_modified and self.records:
+                self.last_sync = now
+                if full:
+                    self.last_full_sync = now
+                return
+            if not full and self._ignored_delta(changed):
+                self.deltas_supported = False
+                full = True
+
+            self._merge(changed, full)
+            if full:
+                self.watermark = None
+                self.last_full_sync = now
+            self._advance_watermark(changed)
+            self.last_sync = now
+
+    def values(self) -> list:
+        self.sync()
+        return list(self.records.values())
+
+    def mark_stale(self) -> None:
+        """Next read runs a delta sync right away instead of waiting for SYNC_INTERVAL."""
+        self.last_sync = 0.0
+
+    def upsert(self, record: dict) -> None:
+        """Applies a record created/updated through this app (id-based deltas can't see edits)."""
+        with self._lock:
+            records = dict(self.records)
+            records[record["id"]] = {**records.get(record["id"], {}), **record}
+            self.records = records
+            self.revision += 1
+
+    def discard(self, record_id) -> None:
+        """Drops a record deleted through this app without refetching anything."""
+        with self._lock:
+            if record_id in self.records:
+                records = dict(self.records)
+                records.pop(record_id)
+                self.records = records
+                self.revision += 1
+
+    def _reconcile(self) -> None:
+        try:
+            self.sync(force=True)
+            self.last_error = None
+        except Exception as e:
+            # Keep serving the optimistic snapshot; the next read retries
+            self.last_error = e
+            self.mark_stale()
+
+    def refresh_in_background(self) -> None:
+        """Re-syncs with the API on a background thread; at most one refresh per store is queued."""
+        if self._pending is not None and not self._pending.done():
+            return
+        self._pending = _BACKGROUND.submit(with_script_ctx(self._reconcile))
+
+    def reset(self) -> None:
+        """Forces the next read to take a full snapshot."""
+        with self._lock:
+            self.watermark = None
+            self.last_sync = 0.0
+
+
+@st.cache_resource
+def get_delta_store(path: str) -> DeltaStore:
+    return DeltaStore(path)
+
+
+def get_order_store() -> DeltaStore:
+    return get_delta_store("/order/")
+
+
+def get_customer_store() -> DeltaStore:
+    return get_delta_store("/customer_request/")
+
+
+def get_parameter_store() -> DeltaStore:
+    return get_delta_store("/parameter/")
+
+
+def get_sample_store() -> DeltaStore:
+    return get_delta_store("/samples/get_sample")
+
+
+def get_department_store() -> DeltaStore:
+    return get_delta_store("/department/")
+
+
+def get_employee_store() -> DeltaStore:
+    return get_delta_store("/employee/")
+
+
+def apply_mutation(store: DeltaStore, response, record: dict = None, deleted_id=None) -> bool:
+    """Applies a successful create/update/delete to the local snapshot, then reconciles in the background.
+
+    ``record`` defaults to the response body (the created row); pass ``deleted_id``
+    for deletes. Returns False, leaving the store untouched, if the API call failed.
+    """
+    if response.status_code not in (200, 201, 204):
+        return False
+    if deleted_id is not None:
+        store.discard(deleted_id)
+    else:
+        if record is None:
+            try:
+                record = response.json()
+            except ValueError:
+                record = None
+        if isinstance(record, dict) and record.get("id") is not None:
+            store.upsert(record)
+    store.refresh_in_background()
+    return True
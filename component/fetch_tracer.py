@@ -0,0 +1,83 @@
+import contextvars
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+import requests
+import streamlit as st
+
+# Dev mode only: FETCH_TRACE=1 logs every HTTP call per rerun and flags GETs whose body was never read
+TRACE_ENABLED = os.getenv('FETCH_TRACE', '').lower() in ('1', 'true', 'yes')
+
+logger = logging.getLogger("fetch_tracer")
+_calls = contextvars.ContextVar("fetch_trace_calls", default=None)
+
+
+class _TracedResponse(requests.Response):
+    """Marks its trace entry as used once the body is parsed or read as text."""
+
+    def json(self, **kwargs):
+        self._trace_entry["used"] = True
+        return super().json(**kwargs)
+
+    @property
+    def text(self):
+        self._trace_entry["used"] = True
+        return super().text
+
+
+def record(method: str, url: str, ms: float, response) -> None:
+    """Called by api_client for every request; a no-op outside a traced rerun."""
+    calls = _calls.get()
+    if calls is None:
+        return
+    # Only GETs can be wasted fetches; writes count as used
+    entry = {"method": method, "url": url, "ms": round(ms, 1),
+             "status": getattr(response, "status_code", 0), "used": method != "GET"}
+    calls.append(entry)
+    if method == "GET" and response is not None:
+        response.__class__ = _TracedResponse
+        response._trace_entry = entry
+
+
+def mark_used(response) -> None:
+    """For callers that use a response without reading it (a 304 served from the stored body)."""
+    entry = getattr(response, "_trace_entry", None)
+    if entry is not None:
+        entry["used"] = True
+
+
+@contextmanager
+def trace_rerun(page: str):
+    """Collects the HTTP calls made while the page runs, then reports them.
+
+    Worker threads started through concurrency.with_script_ctx record into the same rerun.
+    """
+    if not TRACE_ENABLED:
+        yield
+        return
+    token = _calls.set([])
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        # st.rerun()/st.stop() end the run early: log only, the page is being torn down
+        _report(page, _calls.get(), (time.perf_counter() - start) * 1000, show=False)
+        raise
+    else:
+        _report(page, _calls.get(), (time.perf_counter() - start) * 1000)
+    finally:
+        _calls.reset(token)
+
+
+def _report(page: str, calls: list, ms: float, show: bool = True) -> None:
+    unused = [c for c in calls if not c["used"]]
+    logger.warning("%s: %d HTTP call(s), %d unused, rerun %.0f ms", page, len(calls), len(unused), ms)
+    for c in calls:
+        logger.warning("  %s %s %s %.0f ms%s", c["method"], c["url"], c["status"], c["ms"],
+                       "" if c["used"] else "  <-- result never used")
+    if unused and show:
+        with st.sidebar.expander(f"🐞 {len(unused)} unused fetch(es) on this rerun"):
+            for c in unused:
+                st.caption(f"{c['method']} {c['url']} ({c['ms']:.0f} ms)")
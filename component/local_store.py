@@ -1,34 +1,201 @@
+import atexit
+import hashlib
 import json
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 import streamlit as st
 
+# (namespace, session) entries kept in memory; the least recently used are dropped first
+CACHE_SIZE = int(os.getenv('LOCAL_STORE_CACHE_SIZE', 1000))
+# Set by the Streamlit server on the first page load (server.enableXsrfProtection, on by default)
+_XSRF_COOKIE = "_streamlit_xsrf"
+
+
+def _browser_token() -> Optional[bytes]:
+    """Raw token of Streamlit's XSRF cookie, or None when the browser didn't send one.
+
+    The cookie is re-masked each time the server sets it ("2|mask|masked|timestamp"),
+    so the mask is removed to get a value that is stable for the browser.
+    """
+    cookie = st.context.cookies.get(_XSRF_COOKIE)
+    if not cookie:
+        return None
+    try:
+        if cookie.startswith("2|"):
+            _, mask, masked, _ = cookie.split("|")
+            mask, masked = bytes.fromhex(mask), bytes.fromhex(masked)
+            return bytes(b ^ mask[i % len(mask)] for i, b in enumerate(masked))
+        return bytes.fromhex(cookie)
+    except ValueError:
+        return None
+
+
+def session_key() -> str:
+    """Per-browser storage key, derived on the server from a cookie the server issued.
+
+    Survives a refresh, but can't be chosen or handed over through a link. Without
+    the cookie (XSRF protection turned off) the key lasts for this script session only.
+    """
+    if "session_key" not in st.session_state:
+        token = _browser_token()
+        st.session_state.session_key = (
+            hashlib.sha256(b"local_storage:" + token).hexdigest() if token else secrets.token_hex(32)
+        )
+    return st.session_state.session_key
+
+
+class _SqliteStore:
+    """Key/value rows in SQLite (WAL mode) with a read-through memory cache and a write-behind thread.
+
+    Reads are served from memory after the first load of a (namespace, session);
+    writes update memory at once and are committed in batches, one transaction
+    per batch. SQLite's file locking keeps several server processes consistent.
+    At most ``cache_size`` sessions stay in memory; one with uncommitted writes
+    is never dropped, so a reload can't miss them.
+    """
+
+    def __init__(self, path: Path, cache_size: int = CACHE_SIZE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._writes = queue.Queue()
+
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS local_storage ("
+                "namespace TEXT NOT NULL, session TEXT NOT NULL, key TEXT NOT NULL, value TEXT, "
+                "PRIMARY KEY (namespace, session, key))"
+            )
+        finally:
+            conn.close()
+
+        threading.Thread(target=self._writer, name="local-store-writer", daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout=10000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _evict(self) -> None:
+        # Called with the lock held
+        for cache_key in list(self._cache):
+            if len(self._cache) <= self.cache_size:
+                break
+            if not self._pending.get(cache_key):
+                del self._cache[cache_key]
+
+    def _items(self, namespace: str, session: str) -> dict:
+        cache_key = (namespace, session)
+        with self._lock:
+            items = self._cache.get(cache_key)
+            if items is None:
+                conn = self._connect()
+                try:
+                    rows = conn.execute(
+                        "SELECT key, value FROM local_storage WHERE namespace = ? AND session = ?",
+                        (namespace, session)
+                    ).fetchall()
+                finally:
+                    conn.close()
+                items = self._cache[cache_key] = {key: json.loads(value) for key, value in rows}
+                self._evict()
+            else:
+                self._cache.move_to_end(cache_key)
+        return items
+
+    def get(self, namespace: str, session: str, key: str) -> Any:
+        return self._items(namespace, session).get(key)
+
+    def set(self, namespace: str, session: str, key: str, value: Any) -> None:
+        encoded = json.dumps(value)
+        items = self._items(namespace, session)
+        with self._lock:
+            items[key] = json.loads(encoded)
+            self._pending[(namespace, session)] = self._pending.get((namespace, session), 0) + 1
+        self._writes.put((namespace, session, key, encoded))
+
+    def _drain(self, first) -> list:
+        batch = [first]
+        while True:
+            try:
+                batch.append(self._writes.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _commit(self, batch: list) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO local_storage (namespace, session, key, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (namespace, session, key) DO UPDATE SET value = excluded.value",
+                batch
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _writer(self) -> None:
+        while True:
+            batch = self._drain(self._writes.get())
+            # Retry the same batch (e.g. database locked) so writes are never reordered
+            while True:
+                try:
+                    self._commit(batch)
+                    break
+                except sqlite3.Error:
+                    time.sleep(1.0)
+            with self._lock:
+                for namespace, session, _, _ in batch:
+                    cache_key = (namespace, session)
+                    self._pending[cache_key] -= 1
+                    if not self._pending[cache_key]:
+                        del self._pending[cache_key]
+                self._evict()
+            for _ in batch:
+                self._writes.task_done()
+
+    def flush(self) -> None:
+        """Blocks until every queued write is committed."""
+        self._writes.join()
+
+
+@st.cache_resource
+def _get_store(storage_dir: str) -> _SqliteStore:
+    return _SqliteStore(Path(storage_dir) / "local_storage.sqlite3")
+
+
 class LocalStorageManager:
+    """Per-session key/value storage that survives page refreshes and server restarts.
+
+    Values are scoped to this browser's server-derived key, so one user's items
+    are never visible to another. Reads come from memory; writes are persisted in
+    the background.
+    """
+
     def __init__(self, user_name: str, storage_dir: str = "user_storage"):
         self.user_name = user_name
-        self.storage_dir = Path(storage_dir)
-        self.storage_file = self.storage_dir / f"{self.user_name}.json"
-        self.load_storage()
-
-    def load_storage(self) -> None:
-        """Loads storage from the user-specific JSON file."""
-        if self.storage_file.exists():
-            with open(self.storage_file, 'r') as f:
-                st.session_state['local_storage'] = json.load(f)
-        else:
-            st.session_state['local_storage'] = {}
-
-    def save_storage(self) -> None:
-        """Saves storage to the user-specific JSON file."""
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.storage_file, 'w') as f:
-            json.dump(st.session_state['local_storage'], f)
+        self.session = session_key()
+        self.store = _get_store(storage_dir)
 
     def set_item(self, key: str, value: Any) -> None:
         """Sets a value in local storage and persists it."""
-        st.session_state['local_storage'][key] = value
-        self.save_storage()
+        self.store.set(self.user_name, self.session, key, value)
 
     def get_item(self, key: str) -> Any:
         """Gets a value from local storage."""
-        return st.session_state['local_storage'].get(key, None)
+        return self.store.get(self.user_name, self.session, key)
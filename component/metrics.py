@@ -0,0 +1,151 @@
+import functools
+import re
+import threading
+import time
+from typing import Any, Callable
+
+import streamlit as st
+
+# Latency histogram bucket upper bounds, in milliseconds (the last bucket is open-ended)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """"GET /order/order_id/{id}" — ids and the query string are folded so endpoints stay few."""
+    path = url.split("?", 1)[0].split("://", 1)[-1]
+    path = "/" + path.split("/", 1)[1] if "/" in path else "/"
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= rank:
+                return round(min(bound, self.max_ms), 1)
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": {("inf" if b == float("inf") else str(b)): n for b, n in zip(LATENCY_BUCKETS_MS, self.counts)},
+        }
+
+
+class Metrics:
+    """Process-wide counters for HTTP calls, caches and page reruns (shared by all sessions)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.time()
+            self.endpoints = {}
+            self.caches = {}
+            self.reruns = {}
+
+    def record_request(self, method: str, url: str, ms: float, status: int, nbytes: int) -> None:
+        key = endpoint_key(method, url)
+        with self._lock:
+            entry = self.endpoints.get(key)
+            if entry is None:
+                entry = self.endpoints[key] = {"latency": _Histogram(), "bytes": 0, "max_bytes": 0, "errors": 0}
+            entry["latency"].add(ms)
+            entry["bytes"] += nbytes
+            entry["max_bytes"] = max(entry["max_bytes"], nbytes)
+            if not status or status >= 400:
+                entry["errors"] += 1
+
+    def record_cache(self, name: str, hit: bool) -> None:
+        with self._lock:
+            entry = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+
+    def record_rerun(self, page: str, ms: float) -> None:
+        with self._lock:
+            self.reruns.setdefault(page, _Histogram()).add(ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            endpoints = {}
+            for key, entry in self.endpoints.items():
+                latency = entry["latency"].snapshot()
+                endpoints[key] = {
+                    **latency,
+                    "errors": entry["errors"],
+                    "total_bytes": entry["bytes"],
+                    "mean_bytes": entry["bytes"] // latency["count"] if latency["count"] else 0,
+                    "max_bytes": entry["max_bytes"],
+                }
+            caches = {}
+            for name, entry in self.caches.items():
+                lookups = entry["hits"] + entry["misses"]
+                caches[name] = {**entry, "hit_ratio": round(entry["hits"] / lookups, 3) if lookups else None}
+            return {
+                "since": self.started,
+                "endpoints": endpoints,
+                "caches": caches,
+                "reruns": {page: h.snapshot() for page, h in self.reruns.items()},
+            }
+
+
+@st.cache_resource
+def get_metrics() -> Metrics:
+    return Metrics()
+
+
+def cached(name: str, cache_decorator: Callable) -> Callable:
+    """Applies a Streamlit cache decorator and counts its hits and misses under ``name``.
+
+    The function body only runs on a miss, so hits are lookups minus body runs.
+    """
+    def decorate(func: Callable) -> Callable:
+        local = threading.local()
+
+        @functools.wraps(func)
+        def body(*args: Any, **kwargs: Any) -> Any:
+            local.missed = True
+            return func(*args, **kwargs)
+
+        cached_func = cache_decorator(body)
+
+        @functools.wraps(func)
+        def lookup(*args: Any, **kwargs: Any) -> Any:
+            local.missed = False
+            try:
+                return cached_func(*args, **kwargs)
+            finally:
+                get_metrics().record_cache(name, hit=not local.missed)
+
+        lookup.clear = cached_func.clear
+        return lookup
+
+    return decorate
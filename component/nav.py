@@ -19,3 +19,8 @@ login_nav=[
     st.Page("auth_pages/login.py",title="login"),
     st.Page("pages/test.py",title="Test")
 ]
+
+# Only added to the navigation for users with the admin role
+admin_nav=[
+    st.Page("pages/diagnostics.py", title="Diagnostics"),
+]
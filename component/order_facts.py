@@ -0,0 +1,133 @@
+import json
+
+import pandas as pd
+import streamlit as st
+from component import data_cache
+from component import metrics
+
+FACT_COLLECTIONS = ["customers", "orders", "quotations", "samples", "order_parameters", "parameters"]
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ["order_status", "sample_type", "sample_condition", "collected_by", "sample_location"]
+
+
+# Merge keys; held as objects so an empty (all-NaN float) column still joins against ids or text
+JOIN_KEYS = ["quotation_id", "order_id", "customer_id", "order_number", "parameter_id"]
+
+
+def _frame(records: list, columns: dict) -> pd.DataFrame:
+    """DataFrame with exactly the given source columns (missing ones become NaN), renamed."""
+    df = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+    df = df.reindex(columns=list(columns)).rename(columns=columns)
+    keys = [column for column in JOIN_KEYS if column in df.columns]
+    df[keys] = df[keys].astype(object)
+    return df
+
+
+def _clean_order_parameters(order_parameters: list) -> tuple:
+    """Parses JSON-string rows and drops malformed ones; returns (rows, skipped_count)."""
+    rows, skipped = [], 0
+    for op in order_parameters:
+        if isinstance(op, str):
+            try:
+                op = json.loads(op)
+            except json.JSONDecodeError:
+                skipped += 1
+                continue
+        if isinstance(op, dict) and "quotation_id" in op and "parameter_id" in op:
+            rows.append(op)
+        else:
+            skipped += 1
+    return rows, skipped
+
+
+def build_order_facts(data: dict) -> dict:
+    """Joins the raw collections into one row per quotation with vectorized merges.
+
+    Returns {"invoices": DataFrame, "parameter_lines": DataFrame, "skipped": int}.
+    """
+    quotes = _frame(data.get("quotations", []), {"id": "quotation_id", "order_id": "order_id", "pdf_url": "pdf_url"})
+    quotes = quotes.drop_duplicates("quotation_id")
+
+    orders = _frame(data.get("orders", []), {
+        "id": "order_id", "customer_id": "customer_id", "order_number": "order_number",
+        "status": "order_status", "order_req_comment": "order_req_comment", "order_req_doc": "order_req_doc"
+    }).drop_duplicates("order_id")
+
+    customers = _frame(data.get("customers", []), {
+        "id": "customer_id", "name": "customer_name", "email": "customer_email", "c_name": "company_name",
+        "gst_number": "gst_number", "phone_number": "phone_number", "whatsapp_number": "whatsapp_number",
+        "address": "address"
+    }).drop_duplicates("customer_id")
+
+    # Samples reference the order by its order_number; the last one wins like the old dict map
+    samples = _frame(data.get("samples", []), {
+        "order_id": "order_number", "sample_type": "sample_type", "particulars": "sample_particulars",
+        "collected_by": "collected_by", "collect_date": "collect_date", "location": "sample_location",
+        "condition": "sample_condition"
+    }).drop_duplicates("order_number", keep="last")
+    samples["has_sample"] = True
+
+    op_rows, skipped = _clean_order_parameters(data.get("order_parameters", []))
+    params = _frame(data.get("parameters", []), {"id": "parameter_id", "name": "parameter_name", "price": "price"})
+    params["price"] = pd.to_numeric(params["price"], errors="coerce")
+    lines = _frame(op_rows, {"quotation_id": "quotation_id", "parameter_id": "parameter_id"})
+    lines = lines.merge(params, on="parameter_id", how="inner")
+
+    totals = lines.groupby("quotation_id").agg(param_count=("parameter_id", "size"), param_total=("price", "sum"))
+
+    invoices = (
+        quotes
+        .merge(orders, on="order_id", how="left")
+        .merge(customers, on="customer_id", how="left")
+        .merge(samples, on="order_number", how="left")
+        .merge(totals, left_on="quotation_id", right_index=True, how="left")
+    )
+    invoices["param_count"] = invoices["param_count"].fillna(0).astype(int)
+    invoices["param_total"] = invoices["param_total"].fillna(0)
+    invoices["has_sample"] = invoices["has_sample"].eq(True)
+    for column in CATEGORICAL_COLUMNS:
+        invoices[column] = invoices[column].astype("category")
+    invoices.insert(0, "no", range(1, len(invoices) + 1))
+
+    return {"invoices": invoices.reset_index(drop=True), "parameter_lines": lines, "skipped": skipped}
+
+
+class PartialLoadError(Exception):
+    """Raised inside the cached builder so partial results are never cached."""
+
+    def __init__(self, data: dict, errors: dict):
+        super().__init__(", ".join(errors))
+        self.data = data
+        self.errors = errors
+
+
+@metrics.cached("order_facts", st.cache_data(show_spinner="Building order table...", ttl=data_cache.CACHE_TTL))
+def _cached_order_facts(version: tuple) -> dict:
+    # The collection versions are the cache key; a hit skips reloading the raw collections
+    data, errors = data_cache.fetch_collections(FACT_COLLECTIONS)
+    if errors:
+        raise PartialLoadError(data, errors)
+    return build_order_facts(data)
+
+
+def get_order_facts() -> tuple:
+    """Returns (facts, errors). Facts are cached per data version; partial loads are not cached.
+
+    If the join itself fails, the error is reported with an empty table instead of raised.
+    """
+    try:
+        return _cached_order_facts(data_cache.data_version(*FACT_COLLECTIONS)), {}
+    except PartialLoadError as e:
+        data, errors = e.data, e.errors
+    except Exception as e:
+        data, errors = {}, {"order facts": str(e)}
+    try:
+        return build_order_facts(data), errors
+    except Exception as e:
+        return build_order_facts({}), {**errors, "order facts": str(e)}
+
+
+def records(df: pd.DataFrame) -> list:
+    """Row dicts with NaN turned into None, for rendering a (small) slice."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
@@ -0,0 +1,40 @@
+import math
+
+import streamlit as st
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+def _page_key(key: str) -> str:
+    return f"{key}_page"
+
+
+def _size_key(key: str) -> str:
+    return f"{key}_page_size"
+
+
+def jump_to_index(key: str, index: int) -> None:
+    """Moves the paginator to the page holding items[index]; safe to call from widget callbacks."""
+    page_size = st.session_state.get(_size_key(key), PAGE_SIZES[0])
+    st.session_state[_page_key(key)] = index // page_size + 1
+
+
+def paginate(items: list, key: str, page_sizes: list = PAGE_SIZES) -> tuple:
+    """Renders page-size and page controls and returns (visible_items, offset).
+
+    Works on lists and DataFrames; only the returned slice should be turned into widgets.
+    """
+    col1, col2, col3 = st.columns([1, 1, 2])
+    page_size = col1.selectbox("Page size", page_sizes, key=_size_key(key))
+    total_pages = max(1, math.ceil(len(items) / page_size))
+
+    # Clamp before the widget is created (page size or item count may have shrunk)
+    page_key = _page_key(key)
+    if st.session_state.get(page_key, 1) > total_pages:
+        st.session_state[page_key] = total_pages
+
+    page = col2.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, step=1, key=page_key)
+    offset = (page - 1) * page_size
+    visible = items[offset:offset + page_size]
+    col3.caption(f"Showing {offset + 1 if len(visible) else 0}–{offset + len(visible)} of {len(items)}")
+    return visible, offset
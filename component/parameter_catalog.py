@@ -0,0 +1,121 @@
+from functools import cached_property
+
+import streamlit as st
+from component import data_cache
+from component import metrics
+from component.delta_store import get_parameter_store
+from component.parameter_search import ParameterSearchIndex, SEARCH_LIMIT
+
+
+class ParameterCatalog:
+    """Read-only view of GET /parameter/ with the indexes every page needs.
+
+    Built once per parameter snapshot revision and shared between sessions,
+    so never mutate it.
+    """
+
+    def __init__(self, parameters: list):
+        self.parameters = parameters
+        self.by_id = {p["id"]: p for p in parameters}
+
+        # parent_id -> children (None holds the top-level categories)
+        self.children = {}
+        for p in parameters:
+            self.children.setdefault(p.get("parent_id"), []).append(p)
+        self.priced = [p for p in parameters if p.get("price") is not None]
+
+    # Derived indexes are built on first use and then kept for this catalog version
+
+    @cached_property
+    def leaves(self) -> list:
+        used_as_parent = {pid for pid in self.children if pid is not None}
+        return [p for p in self.parameters if p["id"] not in used_as_parent]
+
+    @cached_property
+    def priced_ids(self) -> set:
+        return {p["id"] for p in self.priced}
+
+    @cached_property
+    def lower_names(self) -> dict:
+        """id -> lowercase name."""
+        return {p["id"]: (p.get("name") or "").lower() for p in self.parameters}
+
+    @cached_property
+    def name_index(self) -> dict:
+        """lowercase name -> ids."""
+        index = {}
+        for param_id, lower_name in self.lower_names.items():
+            index.setdefault(lower_name, []).append(param_id)
+        return index
+
+    @cached_property
+    def path_titles(self) -> dict:
+        return {p["id"]: self._build_path(p["id"]) for p in self.parameters}
+
+    @cached_property
+    def search_index(self) -> ParameterSearchIndex:
+        return ParameterSearchIndex(self.parameters)
+
+    @cached_property
+    def priced_rows(self) -> list:
+        """Priced parameters with their full "A > B > C" title, for pickers and exports."""
+        return [
+            {
+                "id": param["id"],
+                "title": self.path_title(param["id"]),
+                "name": param["name"],
+                "price": param["price"],
+                "parent_id": param.get("parent_id")
+            }
+            for param in self.priced
+        ]
+
+    def _build_path(self, param_id) -> str:
+        names = []
+        seen = set()
+        while param_id is not None and param_id in self.by_id and param_id not in seen:
+            seen.add(param_id)
+            param = self.by_id[param_id]
+            names.append(param.get("name", "Unnamed"))
+            param_id = param.get("parent_id")
+        return " > ".join(reversed(names))
+
+    def name_of(self, param_id, default: str = "") -> str:
+        param = self.by_id.get(param_id)
+        return param["name"] if param else default
+
+    def path_title(self, param_id) -> str:
+        return self.path_titles.get(param_id, "")
+
+    def search(self, term: str, limit: int = SEARCH_LIMIT, priced_only: bool = False) -> list:
+        """Ranked prefix/substring/fuzzy name search; an empty term returns the full list."""
+        if not (term or "").strip():
+            return self.priced if priced_only else self.parameters
+        allowed_ids = self.priced_ids if priced_only else None
+        return self.search_index.search(term, limit=limit, allowed_ids=allowed_ids)
+
+
+@metrics.cached("parameter_catalog", st.cache_resource(show_spinner="Fetching data...", max_entries=2))
+def _cached_catalog(revision: int, _parameters: list) -> ParameterCatalog:
+    return ParameterCatalog(_parameters)
+
+
+def get_parameter_catalog() -> ParameterCatalog:
+    """Catalog over the shared parameter snapshot, rebuilt only when the snapshot revision changes."""
+    store = get_parameter_store()
+    parameters = store.values()
+    return _cached_catalog(store.revision, parameters)
+
+
+def load_parameter_catalog() -> ParameterCatalog:
+    """Page-facing loader: reports API errors and falls back to an empty (uncached) catalog."""
+    try:
+        return get_parameter_catalog()
+    except Exception as e:
+        st.error(f"❌ Cannot load parameters: {e}")
+        return ParameterCatalog([])
+
+
+def invalidate_parameter_catalog() -> None:
+    """Call after a parameter is created, updated or deleted (after applying it to the store)."""
+    data_cache.invalidate_parameters()
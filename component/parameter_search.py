@@ -0,0 +1,106 @@
+import re
+from bisect import bisect_left
+
+SEARCH_LIMIT = 50
+FUZZY_THRESHOLD = 0.4
+
+# Match tiers, best first
+EXACT, STARTS_WITH, TOKEN_PREFIX, SUBSTRING, FUZZY = range(5)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ParameterSearchIndex:
+    """Token + trigram inverted index over parameter names.
+
+    Built once with the catalog; a query only touches the postings of its own
+    tokens/trigrams instead of lowercasing and scanning every name.
+    """
+
+    def __init__(self, parameters: list):
+        self.by_id = {p["id"]: p for p in parameters}
+        self.names = {p["id"]: _normalize(p.get("name")) for p in parameters}
+
+        self.token_postings = {}
+        self.trigram_postings = {}
+        for param_id, name in self.names.items():
+            for token in set(_TOKEN_RE.findall(name)):
+                self.token_postings.setdefault(token, set()).add(param_id)
+            for trigram in _trigrams(name):
+                self.trigram_postings.setdefault(trigram, set()).add(param_id)
+
+        self.vocabulary = sorted(self.token_postings)
+
+    def _prefix_ids(self, prefix: str) -> set:
+        """Ids having a name token that starts with prefix (binary search over the vocabulary)."""
+        ids = set()
+        i = bisect_left(self.vocabulary, prefix)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            ids |= self.token_postings[self.vocabulary[i]]
+            i += 1
+        return ids
+
+    def _substring_ids(self, query: str) -> set:
+        if len(query) < 3:
+            # Too short for trigrams: scan the (much smaller) token vocabulary
+            ids = set()
+            for token in self.vocabulary:
+                if query in token:
+                    ids |= self.token_postings[token]
+            return ids
+        postings = [self.trigram_postings.get(t, set()) for t in _trigrams(query) if t.strip()]
+        candidates = set.intersection(*postings) if postings else set()
+        return {pid for pid in candidates if query in self.names[pid]}
+
+    def _fuzzy_scores(self, query: str) -> dict:
+        query_trigrams = _trigrams(query)
+        overlap = {}
+        for trigram in query_trigrams:
+            for pid in self.trigram_postings.get(trigram, ()):
+                overlap[pid] = overlap.get(pid, 0) + 1
+        return {pid: count / len(query_trigrams) for pid, count in overlap.items()
+                if count / len(query_trigrams) >= FUZZY_THRESHOLD}
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT, allowed_ids=None) -> list:
+        """Returns parameters ranked exact > starts-with > token prefix > substring > fuzzy."""
+        query = _normalize(query)
+        if not query:
+            return []
+
+        ranks = {}
+
+        def rank(ids, tier, score=1.0):
+            for pid in ids:
+                if allowed_ids is not None and pid not in allowed_ids:
+                    continue
+                if pid not in ranks or (tier, -score) < ranks[pid][:2]:
+                    ranks[pid] = (tier, -score)
+
+        tokens = _TOKEN_RE.findall(query)
+        if tokens:
+            rank(set.intersection(*(self._prefix_ids(t) for t in tokens)), TOKEN_PREFIX)
+        rank(self._substring_ids(query), SUBSTRING)
+        if len(query) >= 3:
+            for pid, score in self._fuzzy_scores(query).items():
+                rank([pid], FUZZY, score)
+
+        for pid in list(ranks):
+            name = self.names[pid]
+            if name == query:
+                ranks[pid] = (EXACT, -1.0)
+            elif name.startswith(query):
+                ranks[pid] = (STARTS_WITH, -1.0)
+
+        ordered = sorted(ranks, key=lambda pid: (*ranks[pid], len(self.names[pid]), self.names[pid]))
+        if limit:
+            ordered = ordered[:limit]
+        return [self.by_id[pid] for pid in ordered]
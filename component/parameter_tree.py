@@ -0,0 +1,52 @@
+import streamlit as st
+from component.parameter_catalog import ParameterCatalog
+
+INDENT = " "  # em-space for visual indent
+
+
+def render_parameter_row(param: dict, level: int = 0, qty_label: str = "Enter Quantity for") -> None:
+    """Checkbox + quantity for one priced parameter, kept in sync with selected_parameters."""
+    param_id = param["id"]
+    name = param["name"]
+    price = param["price"]
+    indent = INDENT * level
+    selected = st.session_state.selected_parameters.get(param_id)
+
+    # Default from the selection so a row re-created after its category was
+    # collapsed comes back checked instead of silently dropping the parameter
+    checked = st.checkbox(f"{indent}{name} ₹{price}", key=f"{param_id}_{name}", value=selected is not None)
+
+    if checked:
+        qty = st.number_input(f"{indent}{qty_label} {name}", min_value=1, step=1, key=f"qty_{param_id}",
+                              value=selected["quantity"] if selected else 1)
+        total_cost = int(price) * int(qty)
+        st.markdown(f"**{indent}Total: ₹{price} × {qty} = ₹{total_cost}**")
+
+        st.session_state.selected_parameters[param_id] = {
+            "name": name,
+            "cost": int(price),
+            "quantity": int(qty),
+            "total": total_cost
+        }
+    else:
+        st.session_state.selected_parameters.pop(param_id, None)
+
+
+def render_parameter_tree(catalog: ParameterCatalog, parent_id=None, level: int = 0) -> None:
+    """Renders the subtree under parent_id from the catalog's children index.
+
+    Categories are collapsed toggles and their children only create widgets once
+    opened, so each node is visited at most once and closed branches cost nothing.
+    """
+    for param in catalog.children.get(parent_id, []):
+        param_id = param["id"]
+
+        if param.get("price") is not None:
+            render_parameter_row(param, level)
+            if param_id in catalog.children:
+                render_parameter_tree(catalog, param_id, level + 1)
+            continue
+
+        opened = st.toggle(f"{INDENT * level}{param['name']}", key=f"open_{param_id}")
+        if opened:
+            render_parameter_tree(catalog, param_id, level + 1)
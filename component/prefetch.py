@@ -0,0 +1,74 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from component import data_cache
+from component.concurrency import MAX_WORKERS, with_script_ctx
+from component.delta_store import (
+    get_customer_store, get_order_store, get_parameter_store, get_sample_store,
+    get_department_store, get_employee_store
+)
+from component.order_facts import get_order_facts
+from component.quotation_loader import load_quotation_rows
+
+logger = logging.getLogger(__name__)
+
+# Shared snapshots read by the pages, plus the raw collections the joined views are built from
+STORES = [get_customer_store, get_order_store, get_parameter_store, get_sample_store,
+          get_department_store, get_employee_store]
+COLLECTIONS = ["customers", "orders", "quotations", "parameters", "samples", "order_parameters"]
+# Joined views behind the Dashboard, Quotation List and Invoice list, built once the collections are in
+DERIVED = {"order facts": get_order_facts, "quotation rows": load_quotation_rows}
+
+
+class _Prefetcher:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = False
+
+    def _tasks(self) -> tuple:
+        # Built on the script thread so each task carries its script run context
+        tasks = {f"store {get_store().path}": get_store().sync for get_store in STORES}
+        for name in COLLECTIONS:
+            tasks[f"collection {name}"] = lambda name=name: data_cache.fetch_collection(name)
+        fetches = {name: with_script_ctx(task) for name, task in tasks.items()}
+        return fetches, {name: with_script_ctx(task) for name, task in DERIVED.items()}
+
+    def _run_all(self, tasks: dict) -> None:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tasks)), thread_name_prefix="prefetch") as pool:
+            futures = {name: pool.submit(task) for name, task in tasks.items()}
+        for name, future in futures.items():
+            if future.exception() is not None:
+                logger.warning("Prefetch of %s failed: %s", name, future.exception())
+
+    def _run(self, fetches: dict, derived: dict) -> None:
+        try:
+            self._run_all(fetches)
+            # Joins read the collections just cached, so they cost no further requests
+            self._run_all(derived)
+        finally:
+            with self._lock:
+                self._running = False
+
+    def start(self) -> bool:
+        """Starts a warm-up in the background; returns False if one is already running."""
+        with self._lock:
+            if self._running:
+                return False
+            self._running = True
+        threading.Thread(target=self._run, args=self._tasks(), name="prefetch", daemon=True).start()
+        return True
+
+
+@st.cache_resource
+def _get_prefetcher() -> _Prefetcher:
+    return _Prefetcher()
+
+
+def start_prefetch() -> bool:
+    """Warms the shared caches after login so the first visit to each page renders from memory.
+
+    Runs on a bounded pool off the script thread; already-fresh snapshots are not refetched.
+    """
+    return _get_prefetcher().start()
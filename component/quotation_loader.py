@@ -0,0 +1,63 @@
+import streamlit as st
+from component import data_cache
+from component import metrics
+from component.concurrency import map_concurrent
+from component.parameter_catalog import get_parameter_catalog
+
+
+def _index_missing(index: dict, wanted_ids: set, fetch_one) -> None:
+    """Fills ids the bulk list did not contain using a bounded pool of per-id calls."""
+    missing = [i for i in wanted_ids if i is not None and i not in index]
+    for record_id, record in map_concurrent(fetch_one, missing).items():
+        if isinstance(record, dict):
+            index[record_id] = record
+
+
+QUOTATION_COLLECTIONS = ("quotations", "orders", "customers", "order_parameters", "parameters")
+
+
+def load_quotation_rows() -> list:
+    """Joined quotation rows, cached until one of the source collections is invalidated."""
+    return _cached_quotation_rows(data_cache.data_version(*QUOTATION_COLLECTIONS))
+
+
+@metrics.cached("quotation_rows", st.cache_data(show_spinner="Fetching data...", ttl=data_cache.CACHE_TTL, max_entries=4))
+def _cached_quotation_rows(version: tuple) -> list:
+    """Joins quotations with orders, customers and parameters in memory.
+
+    Each collection is fetched once; the join itself is dict lookups only.
+    """
+    quotations = data_cache.fetch_quotations()
+
+    orders = {o["id"]: o for o in data_cache.fetch_orders()}
+    _index_missing(orders, {q.get("order_id") for q in quotations}, data_cache.fetch_order_by_id)
+
+    customers = {c["id"]: c for c in data_cache.fetch_customers()}
+    _index_missing(customers, {o.get("customer_id") for o in orders.values()}, data_cache.fetch_customer_by_id)
+
+    parameters = get_parameter_catalog().by_id
+
+    params_by_quotation = {}
+    for op in data_cache.fetch_order_parameters():
+        param = parameters.get(op.get("parameter_id"))
+        if param:
+            params_by_quotation.setdefault(op.get("quotation_id"), []).append(param)
+
+    rows = []
+    for quote in quotations:
+        order = orders.get(quote.get("order_id"), {})
+        customer = customers.get(order.get("customer_id"), {})
+        rows.append({
+            "id": quote.get("id"),
+            "pdf_url": quote.get("pdf_url"),
+            "parameters": params_by_quotation.get(quote.get("id"), []),
+            "customer_name": customer.get("name", "Unknown"),
+            "customer_email": customer.get("email", ""),
+            "order_number": order.get("order_number", "")
+        })
+    return rows
+
+
+def invalidate_quotation_rows() -> None:
+    """Call after a quotation is created or deleted."""
+    data_cache.invalidate_quotations()
@@ -1,6 +1,9 @@
+import time
 import streamlit as st
-from component.local_store import LocalStorageManager
-from component.nav import nav_pages,login_nav
+from component.auth_session import current_session
+from component.fetch_tracer import trace_rerun
+from component.metrics import get_metrics
+from component.nav import nav_pages,login_nav,admin_nav
 
 # ✅ Initialize session state
 if "username" not in st.session_state:
@@ -15,19 +18,26 @@ if "login" not in st.session_state:
 st.set_page_config(layout="wide")
 
 
-# ✅ Sync LocalStorage with session state
-storage=LocalStorageManager("user_login_status")
-st.session_state.login = storage.get_item("login_status")
+# ✅ Validate the login session in memory (no disk or network on the hot path)
+st.session_state.login = current_session() is not None
 
 # ✅ Navigation Logic
 if not st.session_state.login:
     # login_page = st.Page("auth_pages/login.py", title="Login")
     pg = st.navigation(login_nav,position="hidden")
-    pg.run()
+    with trace_rerun(pg.title):
+        pg.run()
 else:
     # st.navigation([st.Page("Pages/Dashboard.py")])
-    pg = st.navigation(nav_pages)
+    # Diagnostics is only listed for admins
+    pg = st.navigation(nav_pages + (admin_nav if st.session_state.role == "admin" else []))
     # st.switch_page("Dashboard.py")
-    pg.run()
+    # ✅ Time every page rerun for the diagnostics panel
+    start = time.perf_counter()
+    try:
+        with trace_rerun(pg.title):
+            pg.run()
+    finally:
+        get_metrics().record_rerun(pg.title, (time.perf_counter() - start) * 1000)
     # st.rerun()
 
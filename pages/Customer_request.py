@@ -1,10 +1,22 @@
 import re
 import os
+import uuid
 from datetime import datetime
 import streamlit as st
-import requests
+import pandas as pd
+from component import api_client
+from component.async_fetch import fetch_json
+from component.concurrency import map_concurrent, with_retries
+from component.data_cache import invalidate_orders, invalidate_customers
+from component.delta_store import get_customer_store, get_order_store, apply_mutation
+from component.customer_search import get_customer_search_index, SEARCH_LIMIT
+from component.customer_requests import (
+    QUOTATION_API, fetch_customers_with_orders, render_parameters, render_filtered_parameters
+)
+from component.quotation_loader import invalidate_quotation_rows
 from streamlit import session_state
-from pages.parameter import fetch_parameters
+from component.parameter_catalog import load_parameter_catalog
+from component.pagination import paginate
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,49 +27,12 @@ current_date = datetime.now()
 API_BASE_URL = os.getenv('API_BASE_URL')
 CUSTOMER_API = f"{API_BASE_URL}/customer_request/"
 ORDER_API = f"{API_BASE_URL}/order/"
-QUOTATION_API = f"{API_BASE_URL}/quotations/"
 ORDER_PARAMETER = f"{API_BASE_URL}/order_parameters/"
 
-## Fetch all parameters
-parameters = fetch_parameters()
-# st.write(parameters)
-
 GST_REGEX = r'^[A-Z]{2}[0-9]{10}[A-Z]{1}[0-9A-Z]{1}$'
 
-# Prepare filtered list and child map
-filtered_params = []
-child_map = {}
-
-for param in parameters:
-    price = param.get("price")
-    if price is None:
-        continue  # Skip parameters without a price
-
-    name = param.get("name", "Unnamed")
-    parent_name = param.get("parent_name")
-    child_name = param.get("child_name")
-    parent_id = param.get("parent_id")
-
-    # Build display title
-    if parent_name and child_name:
-        title = f"{parent_name} > {child_name}"
-    elif parent_name:
-        title = f"{parent_name} - {name}"
-    else:
-        title = name
-
-    # Add to filtered list
-    filtered_params.append({
-        "id": param["id"],
-        "title": title,
-        "name": param["name"],
-        "price": param["price"],  # ← Consistent field name
-        "parent_id": param.get("parent_id")
-    })
-
-    # Map children to parent ID
-    if parent_id:
-        child_map.setdefault(parent_id, []).append(param)
+# Backend answers these when it has no bulk order_parameters endpoint
+BULK_UNSUPPORTED = (404, 405, 501)
 
 
 # Initialize session state variables
@@ -73,42 +48,14 @@ if "filter_mode" not in st.session_state:
     st.session_state.filter_mode = False
 if "search_term" not in st.session_state:
     st.session_state.search_term = ""
+if "detail_customer_id" not in st.session_state:
+    st.session_state.detail_customer_id = None
 
 
-# @st.cache_data(show_spinner="Fetching data...", ttl=600)
-def fetch_customers_with_orders():
-    try:
-        customer_response = requests.get(CUSTOMER_API)
-        order_response = requests.get(ORDER_API)
-
-        if customer_response.status_code != 200:
-            st.error(f"Customer API error: {customer_response.status_code}")
-            return []
-
-        if order_response.status_code != 200:
-            st.error(f"Order API error: {order_response.status_code}")
-            return []
-
-        customers = customer_response.json()
-        orders = order_response.json()
-
-        order_map = {order['customer_id']: order for order in orders}
-        for customer in customers:
-            customer_id = customer.get("id")
-            order = order_map.get(customer_id, {})
-            customer["o_number"] = order.get("order_number", "No Order Number")
-            customer["order_req_comment"] = order.get("order_req_comment", "No comment")
-            customer["order_req_doc"] = order.get("order_req_doc", "No document")
-
-        return customers
-    except Exception as e:
-        st.error(f"⚠️ Error: {e}")
-        return []
-
 # ✅ Function to fetch customer details by ID
 def fetch_customer_by_id(customer_id):
     try:
-        customer = requests.get(f"{CUSTOMER_API}{customer_id}").json()
+        customer = fetch_json(f"{CUSTOMER_API}{customer_id}")
         return customer
     except Exception as e:
         st.error(f"⚠️ Error fetching customer details: {e}")
@@ -117,7 +64,7 @@ def fetch_customer_by_id(customer_id):
 # ✅ Function to fetch order details by customer ID
 def fetch_order_by_customer_id(customer_id):
     try:
-        order = requests.get(f"{ORDER_API}c_id/{customer_id}").json()
+        order = fetch_json(f"{ORDER_API}c_id/{customer_id}")
         return order
     except Exception as e:
         st.error(f"⚠️ Error fetching order details: {e}")
@@ -127,7 +74,7 @@ def fetch_order_by_customer_id(customer_id):
 # ✅ Function to create customer and order
 def create_customer_and_order(data, comment, docfile):
     try:
-        response = requests.post(CUSTOMER_API, json=data)
+        response = api_client.post(CUSTOMER_API, json=data)
         if response.status_code == 200:
             customer = response.json()
             customer_id = customer.get("id")
@@ -140,8 +87,13 @@ def create_customer_and_order(data, comment, docfile):
                 "order_number" : f"{customer_name}/{formatted_date}/ORDERNo{customer_id}"
             }
             files = {'docfile': docfile} if docfile else None
-            order_response = requests.post(ORDER_API, data=order_data, files=files)
+            order_response = api_client.post(ORDER_API, data=order_data, files=files)
             if order_response.status_code == 200:
+                # Shown from the local snapshots right away; both reconcile in the background
+                apply_mutation(get_customer_store(), response, record=customer)
+                apply_mutation(get_order_store(), order_response)
+                invalidate_customers()
+                invalidate_orders()
                 st.success("✅ Customer and Order created successfully!")
                 st.session_state.show_form = False
                 st.rerun()
@@ -157,7 +109,7 @@ def create_customer_and_order(data, comment, docfile):
 # ✅ Function to update customer and order
 def update_customer_and_order(customer_id, order_id, data, comment, docfile):
     try:
-        response = requests.put(f'{CUSTOMER_API}{customer_id}', json=data)
+        response = api_client.put(f'{CUSTOMER_API}{customer_id}', json=data)
         if response.status_code == 200:
             order_data = {
                 "customer_id": customer_id,
@@ -166,11 +118,16 @@ def update_customer_and_order(customer_id, order_id, data, comment, docfile):
             }
             if st.session_state.doc_check != docfile:
                 files = {'docfile': docfile}
-                order_response = requests.put(f"{ORDER_API}{order_id}", data=order_data, files=files)
+                order_response = api_client.put(f"{ORDER_API}{order_id}", data=order_data, files=files)
             else:
-                order_response = requests.put(f"{ORDER_API}{order_id}", data=order_data)
+                order_response = api_client.put(f"{ORDER_API}{order_id}", data=order_data)
 
             if order_response.status_code == 200:
+                # Apply the edit locally: id-based deltas would not pick it up
+                apply_mutation(get_customer_store(), response, record={"id": customer_id, **data})
+                apply_mutation(get_order_store(), order_response, record={"id": order_id, "order_req_comment": comment})
+                invalidate_customers()
+                invalidate_orders()
                 st.success("✅ Customer and Order updated successfully!")
                 st.session_state.show_form = False
                 st.rerun()
@@ -187,72 +144,18 @@ def update_customer_and_order(customer_id, order_id, data, comment, docfile):
 
 # ✅ Function to delete customer and order
 def delete_customer_with_order(c_id, o_id):
-    delete_c = requests.delete(f"{CUSTOMER_API}{c_id}")
-    if delete_c.status_code == 204:
-        delete_o = requests.delete(f"{ORDER_API}{o_id}")
-        if delete_o.status_code == 200:
+    delete_c = api_client.delete(f"{CUSTOMER_API}{c_id}")
+    if apply_mutation(get_customer_store(), delete_c, deleted_id=c_id):
+        invalidate_customers()
+        delete_o = api_client.delete(f"{ORDER_API}{o_id}")
+        if apply_mutation(get_order_store(), delete_o, deleted_id=o_id):
+            invalidate_orders()
             st.success("Deleted Successfully")
         else:
             st.error("❌ Failed to delete Order.")
     else:
         st.error("❌ Failed to delete Customer Request.")
 
-# ✅ Updated function to include quantity and safe deselection
-def render_parameters(parent_id=None, level=0):
-    children = [p for p in parameters if p.get("parent_id") == parent_id]
-
-    for p in children:
-        param_id = p["id"]
-        name = p["name"]
-        price = p.get("price")
-        key = f"{param_id}_{name}"
-        qty_key = f"qty_{param_id}"
-        indent = " " * level  # use em-space for better spacing (visual indent)
-
-        if price is not None:
-            checked = st.checkbox(f"{indent}{name} ₹{price}", key=key)
-
-            if checked:
-                qty = st.number_input(f"{indent}Enter Quantity for {name}", min_value=1, step=1, key=qty_key)
-                total_cost = int(price) * int(qty)
-                st.markdown(f"**{indent}Total: ₹{price} × {qty} = ₹{total_cost}**")
-
-                st.session_state.selected_parameters[param_id] = {
-                    "name": name,
-                    "cost": int(price),
-                    "quantity": int(qty),
-                    "total": total_cost
-                }
-            else:
-                st.session_state.selected_parameters.pop(param_id, None)
-        else:
-            st.markdown(f"**{indent}{name}**")  # just label
-
-        # 🔁 Recurse for children
-        render_parameters(parent_id=param_id, level=level + 1)
-
-# ✅ Updated: render_filtered_parameters() Function
-def render_filtered_parameters():
-    for p in parameters:
-        price = p.get("price")
-        if price is None or st.session_state.search_term not in p["name"].lower():
-            continue  # Skip if no price or doesn't match search
-
-        key = f"{p['id']}_{p['name']}"
-        qty_key = f"qty_{p['id']}"
-        checked = st.checkbox(f"{p['name']} ₹{price}", key=key)
-
-        if checked:
-            qty = st.number_input(f"Qty for {p['name']}", min_value=1, step=1, key=qty_key)
-            st.session_state.selected_parameters[p["id"]] = {
-                "name": p["name"],
-                "cost": int(price),
-                "quantity": int(qty),
-                "total": int(price) * int(qty)
-            }
-        else:
-            st.session_state.selected_parameters.pop(p["id"], None)
-
 # ✅ Create Quotation with Static File Upload
 def create_quotation(customer_id,order_id, selected_param_data):
     try:
@@ -262,11 +165,12 @@ def create_quotation(customer_id,order_id, selected_param_data):
             "parameter_info": selected_param_data
         }
 
-        response = requests.post(QUOTATION_API, json=payload)
+        response = api_client.post(QUOTATION_API, json=payload)
 
         if response.status_code == 200:
             all_info = response.json()
             q_id = all_info.get('quotation_id')
+            invalidate_orders()
             return q_id
         else:
             st.error("❌ Failed to create quotation")
@@ -279,10 +183,20 @@ def create_quotation(customer_id,order_id, selected_param_data):
 
 
 
+def order_parameter_key(quotation_id, param_id):
+    # Stable per row, so a backend that honours Idempotency-Key can drop a retried or resubmitted save
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"order_parameters/{quotation_id}/{param_id}"))
+
+
 def save_selected_parameters_to_api(quotation_id):
+    """Creates all order_parameters rows in one bulk POST, or concurrently per row if the backend has no bulk endpoint.
+
+    Any other bulk failure is reported, not re-posted; per-row saves are retried only on
+    connection errors, and 5xx rows are reported as failed. One consolidated result is reported.
+    """
     selected = st.session_state.get("selected_parameters", {})
-    for param_id, cost in selected.items():
-        payload = {
+    payloads = {
+        param_id: {
             "quotation_id": quotation_id,
             "parameter_id": param_id,
             "cost": cost["cost"],
@@ -290,11 +204,51 @@ def save_selected_parameters_to_api(quotation_id):
             "is_delete": False,
             "is_active": True
         }
-        response = requests.post(ORDER_PARAMETER, json=payload)
-        if response.status_code != 200:
-            st.error(f"❌ Failed to save parameter {param_id}")
-            st.write(payload)
-    st.success(f"✅ Parameter saved")
+        for param_id, cost in selected.items()
+    }
+    if not payloads:
+        return
+
+    try:
+        bulk = api_client.post(
+            f"{ORDER_PARAMETER}bulk", json=list(payloads.values()),
+            headers={"Idempotency-Key": str(uuid.uuid5(uuid.NAMESPACE_URL, f"order_parameters/{quotation_id}"))}
+        )
+    except Exception as e:
+        # The rows may already be written (e.g. a read timeout), so they are not re-posted
+        invalidate_quotation_rows()
+        st.error(f"⚠️ Error saving parameters: {e}")
+        return
+
+    if api_client.is_success(bulk):
+        failures = []
+    elif bulk.status_code in BULK_UNSUPPORTED:
+        def save_one(param_id):
+            headers = {"Idempotency-Key": order_parameter_key(quotation_id, param_id)}
+            # Not idempotent: a 5xx may follow an insert, so only failed connections are retried
+            return with_retries(lambda: api_client.post(ORDER_PARAMETER, json=payloads[param_id], headers=headers),
+                                should_retry=lambda r: False)
+
+        catalog = load_parameter_catalog()
+        failures = []
+        for param_id, outcome in map_concurrent(save_one, list(payloads)).items():
+            if isinstance(outcome, Exception):
+                failures.append({"Parameter": catalog.name_of(param_id, param_id), "Detail": str(outcome)})
+            elif not api_client.is_success(outcome):
+                failures.append({"Parameter": catalog.name_of(param_id, param_id), "Detail": f"HTTP {outcome.status_code}"})
+    else:
+        # A 422 is a validation error and a 5xx may follow a partial insert: report, don't re-post
+        invalidate_quotation_rows()
+        st.error(f"❌ Failed to save parameters (HTTP {bulk.status_code})")
+        st.write(bulk.text)
+        return
+
+    invalidate_quotation_rows()
+    if failures:
+        st.error(f"❌ {len(failures)} of {len(payloads)} parameter(s) failed to save")
+        st.dataframe(pd.DataFrame(failures), use_container_width=True)
+    else:
+        st.success(f"✅ {len(payloads)} parameter(s) saved")
 
 # Function to validate GST number using regex
 def validate_gst_number(gst_number):
@@ -369,21 +323,44 @@ if session_state.login:
     if not customers:
         st.warning("⚠️ No customer requests found")
 
-    search = st.text_input("🔍 Search Customer by name or email", "").lower().strip()
-    # Filter customers based on search input
-    filtered_customers = [
-        customer for customer in customers
-        if search in customer['name'].lower() or search in customer['email'].lower() or search in customer['c_name'].lower()
-]
+    search = st.text_input("🔍 Search Customer by name, email, company, phone or GST", "").strip()
+    # Only searched once the snapshot loaded: the index would re-sync an unreachable backend
     if customers:
-        for customer in filtered_customers:
+        if search:
+            # Top SEARCH_LIMIT ranked hits; a bounded search stops early instead of sorting every match
+            hits = get_customer_search_index().search(search, limit=SEARCH_LIMIT)
+            customers_by_id = {customer["id"]: customer for customer in customers}
+            filtered_customers = [customers_by_id[cid] for cid in hits if cid in customers_by_id]
+            if len(hits) >= SEARCH_LIMIT:
+                st.caption(f"Showing the top {SEARCH_LIMIT} matches; refine the search to narrow them down.")
+        else:
+            filtered_customers = customers
+        visible_customers, offset = paginate(filtered_customers, key="customers")
+
+        # Summary table for browsing; only the selected customer gets the full detail pane
+        summary = st.dataframe(
+            pd.DataFrame([{
+                "Name": c.get("name"),
+                "Email": c.get("email"),
+                "Company": c.get("c_name"),
+                "Order Number": c.get("o_number"),
+                "Phone": c.get("phone_number")
+            } for c in visible_customers]),
+            use_container_width=True, hide_index=True,
+            on_select="rerun", selection_mode="single-row", key=f"customer_table_{offset}"
+        )
+        if summary.selection.rows:
+            st.session_state.detail_customer_id = visible_customers[summary.selection.rows[0]].get("id")
+
+        detail_customers = [c for c in filtered_customers if c.get("id") == st.session_state.detail_customer_id]
+        if not detail_customers:
+            st.info("Select a customer in the table to view details.")
+
+        for customer in detail_customers:
             customer_id = customer.get("id")
 
-            # Check if 'gst' is missing or null
-            if not customer.get('gst'):  # If 'gst' is None, empty string, or falsy
-                customer['gst'] = "Not Found"  # Assign default value to 'gst'
             # session_state.c_id=customer_id
-            with st.expander(f"{customer['name']} - {customer['email']}"):
+            with st.expander(f"{customer['name']} - {customer['email']}", expanded=True):
                 st.write(f"**Order Number :** {customer['o_number']}")
                 st.write(f"**Company Name :** {customer['c_name']}")
                 st.write(f"**GST Number :** {customer['gst']}")
@@ -431,15 +408,8 @@ if session_state.login:
                         st.write(f"document: {customer['order_req_doc']}")
 
                     selected_parameters = {}
-                    parameters = fetch_parameters()
-                    # Split parent and child parameters
-                    parent_parameters = [p for p in parameters if p["price"] is None]
-                    # Create child mapping by parent_id
-                    child_map = {}
-                    for p in parameters:
-                        parent_id = p.get("parent_id")
-                        if parent_id is not None:
-                            child_map.setdefault(parent_id, []).append(p)
+                    # Top-level categories come straight from the catalog index
+                    parent_parameters = [p for p in load_parameter_catalog().children.get(None, []) if p["price"] is None]
 
                     with col2:
                         with col2:
@@ -454,7 +424,7 @@ if session_state.login:
                                             render_parameters(parent["id"])
 
                                 else:
-                                    render_filtered_parameters()
+                                    render_filtered_parameters(search_term)
 
                     with col3:
                         st.subheader("🧾 Selected Parameters")
@@ -1,13 +1,12 @@
 import os
-import requests
 import streamlit as st
 import pandas as pd
-from component.local_store import LocalStorageManager
+from component.order_facts import get_order_facts
+from component.delta_store import get_customer_store, get_sample_store
+from component.customer_search import get_customer_search_index, SEARCH_LIMIT
 from dotenv import load_dotenv
 load_dotenv()
 
-storage = LocalStorageManager("user_login_status")
-
 # Initialize session state variables
 if "form_data" not in st.session_state:
     st.session_state.form_data = []
@@ -32,70 +31,45 @@ if st.session_state.get("login", False):
     st.subheader("📥 Customer Requests")
     try:
         with st.spinner("Fetching customer requests..."):
-            response = requests.get(f"{API_BASE_URL}/customer_request/")
-            if response.status_code == 200:
-                data = response.json()
-                if data:
+            data = get_customer_store().values()
+            if data:
+                # Ranked search over name, company, email, phone and GST
+                search_name = st.text_input("🔍 Search Customer").strip()
+                if search_name:
+                    # Top SEARCH_LIMIT ranked hits; a bounded search stops early instead of sorting every match
+                    hits = get_customer_search_index().search(search_name, limit=SEARCH_LIMIT)
+                    data_by_id = {c["id"]: c for c in data}
+                    df = pd.DataFrame([data_by_id[cid] for cid in hits if cid in data_by_id])
+                    if len(hits) >= SEARCH_LIMIT:
+                        st.caption(f"Showing the top {SEARCH_LIMIT} matches; refine the search to narrow them down.")
+                else:
                     df = pd.DataFrame(data)
-                    df = df.drop(["id", "is_delete"], axis=1, errors='ignore')
-
-                    # Exact search for customer name
-                    search_name = st.text_input("🔍 Search by Exact Customer Name").strip().lower()
-                    if search_name and "customer_name" in df.columns:
-                        df = df[df["c_name"].str.lower() == search_name]
-
-                    st.dataframe(df.set_index(df.columns[0]))
+                df = df.drop(["id", "is_delete"], axis=1, errors='ignore')
+                if df.empty:
+                    st.info("No customer matches that search.")
                 else:
-                    st.warning("⚠️ No customer requests found")
+                    st.dataframe(df.set_index(df.columns[0]))
             else:
-                st.error("❌ Failed to fetch customer requests")
+                st.warning("⚠️ No customer requests found")
     except Exception as e:
         st.error(f"⚠️ Error: {e}")
 
-    # ✅ Customer Quotations Section
+    # ✅ Customer Quotations Section (read from the shared order fact table)
     try:
         with st.spinner("Fetching quotations..."):
-            response = requests.get(f"{API_BASE_URL}/quotations/")
-            if response.status_code == 200:
-                data = response.json()
-
-                if data:
-                    enriched_data = []
-
-                    for quotation in data:
-                        # Get order info
-                        order_id = quotation.get("order_id")
-                        order_resp = requests.get(f"{API_BASE_URL}/order/order_id/{order_id}")
-                        order_number = None
-                        if order_resp.status_code == 200:
-                            order_info = order_resp.json()
-                            if isinstance(order_info, dict):
-                                order_number = order_info.get("order_number")
-
-                        # Build full pdf_url
-                        pdf_filename = quotation.get("pdf_url", "")
-                        pdf_url = f"{API_BASE_URL}static/Quotation/{pdf_filename}" if pdf_filename else ""
-
-                        # Add data with extra fields
-                        enriched_data.append({
-                            **quotation,
-                            "order_number": order_number,
-                            "pdf_url": pdf_url
-                        })
-
-                    # Convert to DataFrame
-                    df = pd.DataFrame(enriched_data)
-
+            facts, errors = get_order_facts()
+            if "quotations" in errors:
+                st.error("❌ Failed to fetch quotations")
+            else:
+                df = facts["invoices"]
+                if not df.empty:
                     # Display links to PDF below
                     st.markdown("### 📄 Quotation PDF Links")
-                    for index, row in df.iterrows():
-                        if row.get("pdf_url"):
-                            st.markdown(f"🔗 [{row.get('order_number', 'Order')}]({row['pdf_url']})", unsafe_allow_html=True)
-
+                    for order_number, pdf_filename in df.loc[df["pdf_url"].notna() & (df["pdf_url"] != ""), ["order_number", "pdf_url"]].itertuples(index=False):
+                        pdf_url = f"{API_BASE_URL}static/Quotation/{pdf_filename}"
+                        st.markdown(f"🔗 [{order_number if isinstance(order_number, str) else 'Order'}]({pdf_url})", unsafe_allow_html=True)
                 else:
                     st.warning("⚠️ No quotations found")
-            else:
-                st.error("❌ Failed to fetch quotations")
     except Exception as e:
         st.error(f"⚠️ Error: {e}")
 
@@ -103,23 +77,20 @@ if st.session_state.get("login", False):
     st.subheader("🧪 Sample Details")
     try:
         with st.spinner("Fetching sample details..."):
-            response = requests.get(f"{API_BASE_URL}/samples/get_sample")
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    df = pd.DataFrame(data)
-                    df = df.drop(["id", "is_delete", "is_active", "updated_at"], axis=1, errors='ignore')
-
-                    # Exact match for sample type
-                    sample_type = st.text_input("🔍 Search by Exact Sample Type").strip().lower()
-                    if sample_type and "sample_type" in df.columns:
-                        df = df[df["sample_type"].str.lower() == sample_type]
-
-                    st.dataframe(df, use_container_width=True)
-                else:
-                    st.warning("⚠️ No sample details found")
+            # Shared sample snapshot (warmed at login)
+            data = get_sample_store().values()
+            if data:
+                df = pd.DataFrame(data)
+                df = df.drop(["id", "is_delete", "is_active", "updated_at"], axis=1, errors='ignore')
+
+                # Exact match for sample type
+                sample_type = st.text_input("🔍 Search by Exact Sample Type").strip().lower()
+                if sample_type and "sample_type" in df.columns:
+                    df = df[df["sample_type"].str.lower() == sample_type]
+
+                st.dataframe(df, use_container_width=True)
             else:
-                st.error("❌ Failed to fetch sample details")
+                st.warning("⚠️ No sample details found")
     except Exception as e:
         st.error(f"⚠️ Error: {e}")
 
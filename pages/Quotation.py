@@ -1,5 +1,6 @@
 import os
-import requests
+from component import api_client
+from component.quotation_loader import load_quotation_rows, invalidate_quotation_rows
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -14,67 +15,10 @@ if "login" not in st.session_state:
 def filter_quotations(data, search_term):
     return [quote for quote in data if search_term.lower() in quote['customer_name'].lower()]
 
-# @st.cache_data(show_spinner="Fetching data...", ttl=600)
-# ✅ Multi-API Call Function
+# ✅ Batched loader: one fetch per collection, joined in memory (cached)
 def get_complete_quotation_data():
     try:
-        quotations_res = requests.get(f"{API_BASE_URL}/quotations/")
-        if quotations_res.status_code != 200:
-            st.error("Failed to fetch quotations.")
-            return []
-
-        quotations = quotations_res.json()
-        combined_data = []
-
-        for quote in quotations:
-            quote_id = quote.get("id")
-            order_id = quote.get("order_id")
-            pdf_url = quote.get("pdf_url")
-
-            # Fetch Order
-            order = {}
-            customer = {}
-            parameters = []
-
-            if order_id:
-                order_res = requests.get(f"{API_BASE_URL}/order/order_id/{order_id}")
-                if order_res.status_code == 200:
-                    order = order_res.json()
-                    customer_id = order.get("customer_id")
-
-                    # Fetch Customer
-                    if customer_id:
-                        cust_res = requests.get(f"{API_BASE_URL}/customer_request/{customer_id}")
-                        if cust_res.status_code == 200:
-                            customer = cust_res.json()
-
-            # Fetch Parameters
-            param_res = requests.get(f"{API_BASE_URL}/order_parameters/op_id/{quote_id}")
-            if param_res.status_code == 200:
-                para = param_res.json()
-                for item in para:
-                    p_id = item["parameter_id"]
-                    if p_id :
-                        p_res= requests.get(f"{API_BASE_URL}/parameter/p_id/{p_id}")
-                        if p_res.status_code == 200:
-                            param_data = p_res.json()
-                            # If it's a list, extend; if it's a dict, append
-                            if isinstance(param_data, list):
-                                parameters.extend(param_data)
-                            elif isinstance(param_data, dict):
-                                parameters.append(param_data)
-
-            combined_data.append({
-                "id": quote_id,
-                "pdf_url": pdf_url,
-                "parameters": parameters,
-                "customer_name": customer.get("name", "Unknown"),
-                "customer_email": customer.get("email", ""),
-                "order_number": order.get("order_number", "")
-            })
-
-        return combined_data
-
+        return load_quotation_rows()
     except Exception as e:
         st.error(f"Error fetching quotation data: {e}")
         return []
@@ -113,8 +57,9 @@ if st.session_state.login:
                     with st.popover("Are you sure you want to delete this quotation?"):
                         c1, c2 = st.columns([1, 1])
                         if c1.button("Yes", key=f"yes_{i}"):
-                            del_res = requests.delete(f"{API_BASE_URL}/quotations/{quote['id']}")
+                            del_res = api_client.delete(f"{API_BASE_URL}/quotations/{quote['id']}")
                             if del_res.status_code == 204:
+                                invalidate_quotation_rows()
                                 st.success(f"Quotation {i} deleted successfully!")
                                 st.rerun()
                             else:
@@ -1,5 +1,9 @@
 import streamlit as st
-import requests
+from component import api_client
+from component.concurrency import map_concurrent
+from component.parameter_catalog import load_parameter_catalog
+from component.data_cache import fetch_order_detail, invalidate_order_detail
+from component.delta_store import get_order_store
 import os
 from dotenv import load_dotenv
 import pandas as pd
@@ -9,11 +13,70 @@ from io import BytesIO
 load_dotenv()
 BASE_API = os.getenv("API_BASE_URL")
 
+# Backend answers these when it has no bulk result endpoint
+BULK_UNSUPPORTED = (404, 405, 501)
+
+
+def build_result_update(res_data):
+    # Home Method, when typed, is saved as the official protocol
+    if res_data["home_protocol"]:
+        return {
+            "result": res_data["result"],
+            "protocol_used": res_data["home_protocol"],
+            "home_protocol": res_data["home_protocol"]
+        }
+    return {
+        "result": res_data["result"],
+        "protocol_used": res_data["protocol_used"],
+        "home_protocol": ""
+    }
+
+
+def submit_results(quotation_id, results_payload):
+    """Saves all results in one batched PUT, or concurrently per row if the backend has no bulk endpoint.
+
+    Any other batch failure is reported for every row, not resent. Returns one status row per parameter.
+    """
+    rows = [res for res in results_payload if res["result"]]
+    updates = {res["parameter_id"]: build_result_update(res) for res in rows}
+
+    try:
+        bulk = api_client.put(
+            f"{BASE_API}/order_parameters/result/{quotation_id}",
+            json=[{"parameter_id": pid, **update} for pid, update in updates.items()]
+        )
+    except Exception as e:
+        return [{"Parameter": res["name"], "Status": "Failed", "Detail": str(e)} for res in rows]
+    if api_client.is_success(bulk):
+        return [{"Parameter": res["name"], "Status": "Saved", "Detail": ""} for res in rows]
+    if bulk.status_code not in BULK_UNSUPPORTED:
+        # A rejected or failed batch is reported as is, not resent row by row
+        return [{"Parameter": res["name"], "Status": "Failed", "Detail": f"HTTP {bulk.status_code}: {bulk.text}"}
+                for res in rows]
+
+    def save_one(parameter_id):
+        url = f"{BASE_API}/order_parameters/result/{quotation_id}/{parameter_id}"
+        # PUT is replayed by the session's own retry policy (connection errors, 502/503/504)
+        return api_client.put(url, json=updates[parameter_id])
+
+    outcomes = map_concurrent(save_one, list(updates))
+    statuses = []
+    for res in rows:
+        outcome = outcomes.get(res["parameter_id"])
+        if isinstance(outcome, Exception):
+            statuses.append({"Parameter": res["name"], "Status": "Failed", "Detail": str(outcome)})
+        elif not api_client.is_success(outcome):
+            statuses.append({"Parameter": res["name"], "Status": "Failed", "Detail": f"HTTP {outcome.status_code}"})
+        else:
+            statuses.append({"Parameter": res["name"], "Status": "Saved", "Detail": ""})
+    return statuses
+
+
 st.title("🧪 Lab Result Submission Portal")
 
-# --- Fetch Orders ---
+# --- Fetch Orders (in-memory snapshot, only changed orders are pulled) ---
 try:
-    orders = requests.get(f"{BASE_API}/order").json()
+    orders = get_order_store().values()
     order_map = {order["order_number"]: order["id"] for order in orders}
     order_numbers = list(order_map.keys())
 except Exception as e:
@@ -26,16 +89,20 @@ selected_order_number = st.selectbox("Select Order Number", order_numbers)
 if selected_order_number:
     order_id = order_map[selected_order_number]
 
-    # --- Fetch Quotation ---
-    quotation = requests.get(f"{BASE_API}/quotations/{order_id}").json()
+    # --- Fetch Quotation + Order Parameters (cached per order) ---
+    try:
+        quotation, order_params = fetch_order_detail(order_id)
+    except Exception as e:
+        st.error(f"Error fetching quotation: {e}")
+        st.stop()
     if not quotation:
         st.warning("No quotation found for this order.")
         st.stop()
 
     quotation_id = quotation["id"]
 
-    # --- Fetch Order Parameters ---
-    order_params = requests.get(f"{BASE_API}/order_parameters/op_id/{quotation_id}").json()
+    # Parameter metadata comes from the cached catalog, so typing in the form costs no requests
+    catalog = load_parameter_catalog()
 
     st.subheader("🔬 Enter Results for Each Parameter")
 
@@ -58,8 +125,7 @@ if selected_order_number:
 
         for i, param in enumerate(order_params, start=1):
             param_id = param['parameter_id']
-            param_details = requests.get(f"{BASE_API}/parameter/p_id/{param_id}").json()
-            param_data = param_details[0]
+            param_data = catalog.by_id.get(param_id, {"name": f"Parameter {param_id}"})
 
             name = param_data["name"]
             unit = param_data.get("unit", "-")
@@ -129,37 +195,18 @@ if selected_order_number:
             if missing_results:
                 st.error("❌ Please fill in the Result field for all parameters before submitting.")
                 st.stop()
+
+            statuses = submit_results(quotation_id, results_payload)
+            failures = [row for row in statuses if row["Status"] != "Saved"]
+            success_count = len(statuses) - len(failures)
+
+            # Also after a failed batch, which may have been applied in part
+            invalidate_order_detail(order_id)
+            if failures:
+                st.error(f"❌ {len(failures)} result(s) failed to save. Submit again to retry them.")
+                st.dataframe(pd.DataFrame(failures), use_container_width=True)
             else:
-                success_count = 0
-
-            for res_data in results_payload:
-                if res_data["result"]:
-                    url = f"{BASE_API}/order_parameters/result/{quotation_id}/{res_data['parameter_id']}"
-
-                    # ✅ Correct logic
-                    if res_data["home_protocol"]:
-                        st.write("hlpppp")# If Home Method is filled
-                        protocol_used = res_data["home_protocol"]  # Save home protocol as the official protocol
-                        home_protocol = res_data["home_protocol"]
-                    else:  # If Home Method is empty
-                        # st.write("hlpppp")
-                        protocol_used = res_data["protocol_used"]  # Save selected radio button
-                        home_protocol = ""  # Nothing typed in home
-
-                    payload = {
-                        "result": res_data["result"],
-                        "protocol_used": protocol_used,
-                        "home_protocol": home_protocol
-                    }
-
-                    res = requests.put(url, json=payload)
-
-                    if res.status_code == 200:
-                        success_count += 1
-                    else:
-                        st.warning(f"⚠️ Failed for Parameter ID {res_data['parameter_id']}")
-
-            st.success(f"✅ Successfully updated {success_count} result(s).")
+                st.success(f"✅ Successfully updated {success_count} result(s).")
 
     # --- Expander to show saved results where result is NOT NULL ---
     saved_results = [r for r in results_payload if r["result"]]
@@ -1,7 +1,9 @@
 import os
 import streamlit as st
 import pandas as pd
-import requests
+from component import api_client
+from component.data_cache import invalidate_samples
+from component.delta_store import get_order_store, get_sample_store, apply_mutation
 from datetime import date
 from dotenv import load_dotenv
 
@@ -17,29 +19,37 @@ st.session_state.setdefault("edit_sample", None)
 # -------------------- API Functions -------------------- #
 def safe_api_call(call, default=[]):
     try:
-        response = call()
-        if response.status_code == 200:
-            return response.json()
-        st.error(f"❌ API Error: {response.status_code} - {response.text}")
+        return call()
     except Exception as e:
         st.error(f"🚨 Exception: {e}")
     return default
 
 def get_all_samples():
-    return safe_api_call(lambda: requests.get(f"{API_BASE}/samples/get_sample"))
+    return safe_api_call(get_sample_store().values)
 
-@st.cache_data(show_spinner="Fetching data...", ttl=600)
 def get_all_orders():
-    return safe_api_call(lambda: requests.get(f"{API_BASE}/order/"))
+    return safe_api_call(get_order_store().values)
+
+def mutate_sample(call, record=None, deleted_id=None):
+    try:
+        response = call()
+        if apply_mutation(get_sample_store(), response, record=record, deleted_id=deleted_id):
+            invalidate_samples()
+            return True
+        st.error(f"❌ API Error: {response.status_code} - {response.text}")
+    except Exception as e:
+        st.error(f"🚨 Exception: {e}")
+    return False
 
 def add_sample(data):
-    return safe_api_call(lambda: requests.post(f"{API_BASE}/samples/", json=data))
+    return mutate_sample(lambda: api_client.post(f"{API_BASE}/samples/", json=data))
 
 def update_sample(sample_id, data):
-    return safe_api_call(lambda: requests.put(f"{API_BASE}/samples/{sample_id}", json=data))
+    return mutate_sample(lambda: api_client.put(f"{API_BASE}/samples/{sample_id}", json=data),
+                         record={"id": sample_id, **data})
 
 def delete_sample(sample_id):
-    return safe_api_call(lambda: requests.delete(f"{API_BASE}/samples/{sample_id}"))
+    return mutate_sample(lambda: api_client.delete(f"{API_BASE}/samples/{sample_id}"), deleted_id=sample_id)
 
 # -------------------- UI Logic -------------------- #
 if not st.session_state.login:
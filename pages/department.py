@@ -1,24 +1,33 @@
 import streamlit as st
-import requests
+from component import api_client
+from component.delta_store import get_department_store, apply_mutation
 import os
 from dotenv import load_dotenv
 load_dotenv()
 
-@st.cache_data(show_spinner="Fetching data...", ttl=600)
-def get_departments():
-    response = requests.get(f"{API_BASE_URL}/department/")
-    return response.json() if response.status_code == 200 else []
-
 API_BASE_URL = os.getenv('API_BASE_URL')
 
+def get_departments():
+    try:
+        return get_department_store().values()
+    except Exception as e:
+        st.error(f"⚠️ Error: {e}")
+        return []
+
 def add_department(department):
-    return requests.post(f"{API_BASE_URL}/department", json=department)
+    response = api_client.post(f"{API_BASE_URL}/department", json=department)
+    apply_mutation(get_department_store(), response)
+    return response
 
 def update_department(dept_id, department):
-    return requests.put(f"{API_BASE_URL}/department/{dept_id}", json=department)
+    response = api_client.put(f"{API_BASE_URL}/department/{dept_id}", json=department)
+    apply_mutation(get_department_store(), response, record={"id": dept_id, **department})
+    return response
 
 def delete_department(dept_id):
-    return requests.delete(f"{API_BASE_URL}/department/{dept_id}")
+    response = api_client.delete(f"{API_BASE_URL}/department/{dept_id}")
+    apply_mutation(get_department_store(), response, deleted_id=dept_id)
+    return response
 
 # Session state for edit mode
 if "edit_id" not in st.session_state:
@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+import streamlit as st
+import pandas as pd
+from component.metrics import get_metrics
+
+# ✅ Admin-only page (also hidden from the navigation for other roles)
+if st.session_state.get("role") != "admin":
+    st.warning("⚠️ Diagnostics are only available to admins.")
+    st.stop()
+
+st.title("📈 Diagnostics")
+metrics = get_metrics()
+snapshot = metrics.snapshot()
+st.caption(f"Collected since {datetime.fromtimestamp(snapshot['since']):%Y-%m-%d %H:%M:%S} (all sessions on this server)")
+
+col1, col2 = st.columns(2)
+col1.download_button(
+    "⬇️ Download JSON", json.dumps(snapshot, indent=2),
+    file_name=f"diagnostics_{datetime.now():%Y%m%d_%H%M%S}.json", mime="application/json"
+)
+if col2.button("🔄 Reset counters"):
+    metrics.reset()
+    st.rerun()
+
+# ✅ API endpoints (slowest first)
+st.subheader("🌐 API calls")
+if snapshot["endpoints"]:
+    endpoints = pd.DataFrame([
+        {"Endpoint": key, "Calls": e["count"], "Errors": e["errors"], "Mean (ms)": e["mean_ms"],
+         "p50 (ms)": e["p50_ms"], "p95 (ms)": e["p95_ms"], "Max (ms)": e["max_ms"],
+         "Mean KB": round(e["mean_bytes"] / 1024, 1), "Max KB": round(e["max_bytes"] / 1024, 1),
+         "Total KB": round(e["total_bytes"] / 1024, 1)}
+        for key, e in snapshot["endpoints"].items()
+    ]).sort_values("p95 (ms)", ascending=False)
+    st.dataframe(endpoints, use_container_width=True, hide_index=True)
+else:
+    st.info("No API calls recorded yet.")
+
+# ✅ Caches
+st.subheader("🗄️ Caches")
+if snapshot["caches"]:
+    st.dataframe(pd.DataFrame([
+        {"Cache": name, "Hits": c["hits"], "Misses": c["misses"], "Hit ratio": c["hit_ratio"]}
+        for name, c in sorted(snapshot["caches"].items())
+    ]), use_container_width=True, hide_index=True)
+else:
+    st.info("No cache lookups recorded yet.")
+
+# ✅ Page reruns
+st.subheader("⏱️ Page reruns")
+if snapshot["reruns"]:
+    st.dataframe(pd.DataFrame([
+        {"Page": page, "Reruns": r["count"], "Mean (ms)": r["mean_ms"], "p50 (ms)": r["p50_ms"],
+         "p95 (ms)": r["p95_ms"], "Max (ms)": r["max_ms"]}
+        for page, r in snapshot["reruns"].items()
+    ]).sort_values("p95 (ms)", ascending=False), use_container_width=True, hide_index=True)
+else:
+    st.info("No page reruns recorded yet.")
+
+with st.expander("Raw JSON"):
+    st.json(snapshot)
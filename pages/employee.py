@@ -1,5 +1,6 @@
 import streamlit as st
-import requests
+from component import api_client
+from component.delta_store import get_employee_store, get_department_store, apply_mutation
 import os
 from dotenv import load_dotenv
 
@@ -7,29 +8,39 @@ load_dotenv()
 
 API_BASE_URL = os.getenv('API_BASE_URL')
 
-@st.cache_data(show_spinner="Fetching data...", ttl=600)
 # --- API Functions ---
 def get_employees():
-    response = requests.get(f"{API_BASE_URL}/employee/")
-    return response.json() if response.status_code == 200 else []
+    try:
+        return get_employee_store().values()
+    except Exception as e:
+        st.error(f"⚠️ Error: {e}")
+        return []
 
 
 def add_employee(employee):
-    return requests.post(f"{API_BASE_URL}/employee", json=employee)
+    response = api_client.post(f"{API_BASE_URL}/employee", json=employee)
+    apply_mutation(get_employee_store(), response)
+    return response
 
 
 def update_employee(emp_id, employee):
-    return requests.put(f"{API_BASE_URL}/employee/{emp_id}", json=employee)
+    response = api_client.put(f"{API_BASE_URL}/employee/{emp_id}", json=employee)
+    apply_mutation(get_employee_store(), response, record={"id": emp_id, **employee})
+    return response
 
 
 def delete_employee(emp_id):
-    return requests.delete(f"{API_BASE_URL}/employee/{emp_id}")
+    response = api_client.delete(f"{API_BASE_URL}/employee/{emp_id}")
+    apply_mutation(get_employee_store(), response, deleted_id=emp_id)
+    return response
 
 
 # --- Department Fetch for Dropdown ---
 def get_departments():
-    res = requests.get(f"{API_BASE_URL}/department/")
-    return res.json() if res.status_code == 200 else []
+    try:
+        return get_department_store().values()
+    except Exception:
+        return []
 
 
 # --- Session state for edit mode ---
@@ -1,9 +1,8 @@
 import os
-import requests
+from component.order_facts import get_order_facts, records
+from component.pagination import paginate, jump_to_index
 import streamlit as st
 from dotenv import load_dotenv
-from collections import defaultdict
-import json
 
 # Load .env and API
 load_dotenv()
@@ -14,123 +13,99 @@ if "login" not in st.session_state:
     st.session_state.login = False
 
 
-# Cache data with extended TTL for API fetch
-@st.cache_data(show_spinner="Fetching data...", ttl=600)
 def fetch_all_data():
-    try:
-        response = {
-            "customers": requests.get(f"{API_BASE_URL}/customer_request/").json(),
-            "orders": requests.get(f"{API_BASE_URL}/order/").json(),
-            "quotations": requests.get(f"{API_BASE_URL}/quotations/").json(),
-            "parameters": requests.get(f"{API_BASE_URL}/parameter/").json(),
-            "samples": requests.get(f"{API_BASE_URL}/samples/get_sample").json(),
-            "order_parameters": requests.get(f"{API_BASE_URL}/order_parameters/").json()
-        }
-        return response
-    except Exception as e:
-        st.error(f"❌ Error: {e}")
-        return {}
+    """Order fact table (one row per quotation) shared with the Dashboard."""
+    facts, errors = get_order_facts()
+    for name, message in errors.items():
+        st.warning(f"⚠️ Could not load {name}: {message}")
+    if facts["skipped"]:
+        st.warning(f"⚠️ Skipped {facts['skipped']} malformed order_parameter entries")
+    return facts
 
 
 if st.session_state.login:
     st.title("📋 Full Order Viewer")
 
     # Fetch data from cache (or API if expired)
-    data = fetch_all_data()
-    if not data:
+    facts = fetch_all_data()
+    invoices = facts["invoices"]
+    if invoices.empty:
         st.error("Failed to load data.")
     else:
-        customers = data.get("customers", [])
-        orders = data.get("orders", [])
-        quotations = data.get("quotations", [])
-        parameters = data.get("parameters", [])
-        samples = data.get("samples", [])
-        order_parameters = data.get("order_parameters", [])
-
-        # Create parameter map (ID -> parameter details)
-        param_map = {param["id"]: {"name": param["name"], "price": param["price"]} for param in parameters}
-
-        # Map customer, order, and sample
-        cust_map = {cust["id"]: cust for cust in customers}
-        order_map = {order["id"]: order for order in orders}
-        sample_map = {samp["order_id"]: samp for samp in samples}
-
-        # Group parameters by quotation_id
-        order_param_map = defaultdict(list)
-
-        # Loop through the order_parameters and group them by quotation_id
-        for op in order_parameters:
-            # Safely parse if JSON string (handling malformed entries)
-            if isinstance(op, str):
-                try:
-                    op = json.loads(op)
-                except json.JSONDecodeError:
-                    st.warning(f"⚠️ Skipping invalid order_parameter entry: {op}")
-                    continue
-
-            # Ensure it's a dict and has required keys
-            if isinstance(op, dict) and "quotation_id" in op and "parameter_id" in op:
-                order_param_map[op["quotation_id"]].append(op["parameter_id"])
+        # Order number -> position, for the jump box
+        order_index = {}
+        for pos, order_number in enumerate(invoices["order_number"]):
+            if order_number:
+                order_index.setdefault(str(order_number).lower(), pos)
+
+        def jump_to_order():
+            pos = order_index.get(st.session_state.invoice_jump.strip().lower())
+            if pos is None:
+                st.session_state.invoice_jump_missed = True
             else:
-                st.warning(f"⚠️ Skipping malformed order_parameter: {op}")
-
-        # Remove duplicate quotations (if API sends duplicates)
-        unique_quotations = []
-        seen_ids = set()
-        for q in quotations:
-            if q["id"] not in seen_ids:
-                unique_quotations.append(q)
-                seen_ids.add(q["id"])
-
-        # Display each quotation
-        for i, quote in enumerate(unique_quotations, 1):
-            order = order_map.get(quote.get("order_id"), {})
-            customer = cust_map.get(order.get("customer_id"), {})
-            sample = sample_map.get(order.get("order_number"))  # Using order_number to find sample
-            pdf_url = quote.get("pdf_url", "")
-            selected_param_ids = order_param_map.get(quote.get("id"), [])  # Fixing `quotation_id` reference
-
-            # Fetching the parameter details based on parameter_id
-            selected_params = [
-                {"name": param_map[param_id]["name"], "price": param_map[param_id]["price"]}
-                for param_id in selected_param_ids if param_id in param_map
-            ]
-
-            # Debug: Print the selected parameters for each quotation
-            # st.write(f"Selected Parameters for Quotation {quote['id']}:", selected_params)
-
-            with st.expander(f"🧾 Invoice Data {i}: {customer.get('name', 'Unknown')}"):
-                st.markdown("### 👤 Customer Info")
-                st.write(f"**Name**: {customer.get('name')}")
-                st.write(f"**Email**: {customer.get('email')}")
-                st.write(f"GST Number: {customer.get('gst', 'Not Found')}")
-                st.write(f"**Phone**: {customer.get('phone_number')}")
-                st.write(f"**WhatsApp**: {customer.get('whatsapp_number')}")
-                st.write(f"**Address**: {customer.get('address')}")
-
-                st.markdown("### 📦 Order Info")
-                st.write(f"**Order No**: {order.get('order_number')}")
-                st.write(f"**Order Comment**: {order.get('order_req_comment')}")
-                st.write(f"**Order Document**: {order.get('order_req_doc')}")
-
-                st.markdown("### 🧪 Parameters")
-                if selected_params:
-                    for param in selected_params:
-                        st.write(f"- {param['name']} — ₹{param['price']}")
-                else:
-                    st.write("No parameters found for this quotation.")
-
-                st.markdown("### 🧾 Quotation PDF")
-                if pdf_url:
-                    st.markdown(f"[📄 Download Quotation PDF]({API_BASE_URL}/static/Quotation/{pdf_url})")
-
-                if sample:
-                    st.markdown("### 🧫 Sample Info")
-                    st.write(f"**Sample Particulars**: {sample.get('particulars')}")
-                    st.write(f"**Collected By**: {sample.get('collected_by')}")
-                    st.write(f"**Date of Collection**: {sample.get('collect_date')}")
-                    st.write(f"**Location**: {sample.get('location')}")
-                else:
-                    st.write("No sample found for this order.")
+                st.session_state.invoice_jump_missed = False
+                jump_to_index("invoices", pos)
+
+        col1, col2 = st.columns([1, 2])
+        view = col1.radio("View", ["Details", "Summary table"], horizontal=True)
+        col2.text_input("🔎 Jump to order number", key="invoice_jump", on_change=jump_to_order)
+        if st.session_state.get("invoice_jump_missed"):
+            col2.caption("No invoice with that order number.")
+
+        if view == "Summary table":
+            st.dataframe(
+                invoices[["no", "order_number", "customer_name", "customer_email", "order_status",
+                          "param_count", "param_total", "has_sample"]].rename(columns={
+                    "no": "No.", "order_number": "Order No", "customer_name": "Customer", "customer_email": "Email",
+                    "order_status": "Status", "param_count": "Parameters", "param_total": "Total (₹)",
+                    "has_sample": "Sample"
+                }),
+                use_container_width=True, hide_index=True
+            )
+        else:
+            # Widgets are only created for the visible page
+            visible, _ = paginate(invoices, key="invoices")
+            lines = facts["parameter_lines"]
+            lines = lines[lines["quotation_id"].isin(visible["quotation_id"])]
+            params_by_quote = {qid: records(group) for qid, group in lines.groupby("quotation_id")}
+
+            for inv in records(visible):
+                selected_params = params_by_quote.get(inv["quotation_id"], [])
+                pdf_url = inv["pdf_url"]
+
+                with st.expander(f"🧾 Invoice Data {inv['no']}: {inv['customer_name'] or 'Unknown'}"):
+                    st.markdown("### 👤 Customer Info")
+                    st.write(f"**Name**: {inv['customer_name']}")
+                    st.write(f"**Email**: {inv['customer_email']}")
+                    st.write(f"GST Number: {inv['gst_number'] or 'Not Found'}")
+                    st.write(f"**Phone**: {inv['phone_number']}")
+                    st.write(f"**WhatsApp**: {inv['whatsapp_number']}")
+                    st.write(f"**Address**: {inv['address']}")
+
+                    st.markdown("### 📦 Order Info")
+                    st.write(f"**Order No**: {inv['order_number']}")
+                    st.write(f"**Order Comment**: {inv['order_req_comment']}")
+                    st.write(f"**Order Document**: {inv['order_req_doc']}")
+
+                    st.markdown("### 🧪 Parameters")
+                    if selected_params:
+                        for param in selected_params:
+                            price = f"{param['price']:g}" if param["price"] is not None else "-"
+                            st.write(f"- {param['parameter_name']} — ₹{price}")
+                    else:
+                        st.write("No parameters found for this quotation.")
+
+                    st.markdown("### 🧾 Quotation PDF")
+                    if pdf_url:
+                        st.markdown(f"[📄 Download Quotation PDF]({API_BASE_URL}/static/Quotation/{pdf_url})")
+
+                    if inv["has_sample"]:
+                        st.markdown("### 🧫 Sample Info")
+                        st.write(f"**Sample Particulars**: {inv['sample_particulars']}")
+                        st.write(f"**Collected By**: {inv['collected_by']}")
+                        st.write(f"**Date of Collection**: {inv['collect_date']}")
+                        st.write(f"**Location**: {inv['sample_location']}")
+                    else:
+                        st.write("No sample found for this order.")
 else:
     st.warning("⚠️ Please login first.")
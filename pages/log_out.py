@@ -1,13 +1,11 @@
-import requests
 import streamlit as st
 from component.nav import login_nav
-from component.local_store import LocalStorageManager
+from component.auth_session import end_session
 import os
 from dotenv import load_dotenv
 load_dotenv()
 
 API_BASE_URL = os.getenv('API_BASE_URL')
-storage=LocalStorageManager("user_login_status")
 
 col1 ,col2  = st.columns([1,2])
 col2.subheader("You are sure to log out !?")
@@ -15,10 +13,8 @@ col2.subheader("You are sure to log out !?")
 col1 , col2 , col3 = st.columns([1,1,1])
 if col2.button("Yes"):
     st.navigation(login_nav,position="hidden")
-    storage.set_item("login_status",False)
+    end_session()
     st.rerun()
 if col3.button("No"):
     st.navigation([st.Page("pages/Dashboard.py")])
     st.rerun()
-
-re=requests.get(f"{API_BASE_URL}/customer_request/")
\ No newline at end of file
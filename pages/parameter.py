@@ -1,6 +1,8 @@
 import os
 import streamlit as st
-import requests
+from component import api_client
+from component.parameter_catalog import load_parameter_catalog, invalidate_parameter_catalog
+from component.delta_store import get_parameter_store, apply_mutation
 from dotenv import load_dotenv
 from perameter_add_in_database_shoertcut.add_parameter import insert_parameter_in_database
 from perameter_add_in_database_shoertcut.unit_and_method_add import insert_unit_and_protocol
@@ -16,18 +18,15 @@ if "edit_param" not in st.session_state:
     st.session_state.edit_param = {}
 
 def create_parameter(data):
-    response = requests.post(f"{PARAMETER_URL}/", json=data)
-    if response.status_code in [200, 201]:
+    response = api_client.post(f"{PARAMETER_URL}/", json=data)
+    # Shown from the local snapshot right away; the store reconciles with the API in the background
+    if apply_mutation(get_parameter_store(), response):
+        invalidate_parameter_catalog()
         st.success("✅ Parameter added successfully!")
         st.rerun()
     else:
         st.error(f"❌ Failed to add parameter: {response.text}")
 
-@st.cache_data(show_spinner="Fetching data...", ttl=600)
-def fetch_parameters():
-    response = requests.get(f"{PARAMETER_URL}/")
-    return response.json() if response.status_code == 200 else []
-
 def update_parameter(inx, parameter_id, parent_id, message_placeholder):
     apha = st.session_state.get(f"edit_apha_{inx}", "")
     is3025 = st.session_state.get(f"edit_is3025_{inx}", "")
@@ -49,16 +48,18 @@ def update_parameter(inx, parameter_id, parent_id, message_placeholder):
         "parent_id": parent_id
     }
 
-    response = requests.put(f"{PARAMETER_URL}/{parameter_id}", json=data)
-    if response.status_code == 200:
+    response = api_client.put(f"{PARAMETER_URL}/{parameter_id}", json=data)
+    if apply_mutation(get_parameter_store(), response, record={"id": parameter_id, **data}):
+        invalidate_parameter_catalog()
         message_placeholder.success("✅ Parameter updated successfully!")
         st.session_state.edit_param[inx] = False
     else:
         message_placeholder.error(f"❌ Failed to update parameter: {response.text}")
 
 def delete_parameter(p_id, message_placeholder):
-    response = requests.delete(f"{PARAMETER_URL}/{p_id}")
-    if response.status_code == 200:
+    response = api_client.delete(f"{PARAMETER_URL}/{p_id}")
+    if apply_mutation(get_parameter_store(), response, deleted_id=p_id):
+        invalidate_parameter_catalog()
         message_placeholder.success("🗑️ Parameter deleted successfully!")
     else:
         message_placeholder.error(f"❌ Failed to delete parameter: {response.text}")
@@ -68,16 +69,16 @@ def is_orphan_parameter(param: dict, all_params: List[dict]) -> bool:
     is_not_parent_of_any = all(p.get('parent_id') != param.get('name') for p in all_params)
     return has_no_parent and is_not_parent_of_any
 
-para = fetch_parameters()
+catalog = load_parameter_catalog()
+para = catalog.parameters
 if not para:
     if st.button("insert Parameter in Database"):
         insert_parameter_in_database()
         insert_unit_and_protocol()
-        st.cache_data.clear()
+        get_parameter_store().reset()
+        invalidate_parameter_catalog()
         st.rerun()
 
-parent_name_map = {param["id"]: param["name"] for param in para}
-
 # --- Add Parameter Form ---
 with st.form("add_parameter_form"):
     st.markdown("### ➕ Add Parameter Info")
@@ -130,13 +131,11 @@ with st.form("add_parameter_form"):
 
 # --- Display Parameters ---
 st.markdown("### 📄 Parameters List")
-display_parameters = fetch_parameters()
 search_query = st.text_input("🔍 Search Parameter by Name")
-if search_query:
-    display_parameters = [p for p in display_parameters if search_query.lower() in p['name'].lower()]
+display_parameters = catalog.search(search_query)
 
 for ind, param in enumerate(display_parameters):
-    parent_name = parent_name_map.get(param.get("parent_id"), "None")
+    parent_name = catalog.name_of(param.get("parent_id"), "None")
     with st.expander(f"🔗 Parent: {parent_name} ➤ Parameter: {param['name']}"):
         st.markdown(f"**🆔 ID:** {param['id']}")
         st.markdown(f"**🧩 Parent ID:** {param.get('parent_id', 'None')}")
@@ -166,7 +165,8 @@ for ind, param in enumerate(display_parameters):
             with st.form(f"edit_param_form_{ind}"):
                 # st.text_input("Edit Parameter Name", value=param['name'], key=f"input_name_{ind}")
                 parent_dropdown_options = ["None"] + [f"{p['id']}. {p['name']}" for p in para]
-                current_parent_value = next((f"{p['id']}. {p['name']}" for p in para if p['id'] == param.get('parent_id')), "None")
+                parent = catalog.by_id.get(param.get('parent_id'))
+                current_parent_value = f"{parent['id']}. {parent['name']}" if parent else "None"
                 selected_parent = st.selectbox("Edit Parent Parameter", options=parent_dropdown_options, index=parent_dropdown_options.index(current_parent_value), key=f"edit_parent_select_{ind}")
                 parent_id = int(selected_parent.split(".")[0]) if selected_parent != "None" else None
                 st.text_input("Edit Price", value=param['price'], key=f"input_price_{ind}")
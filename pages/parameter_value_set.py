@@ -1,5 +1,7 @@
 import streamlit as st
-import requests
+from component import api_client
+from component.parameter_catalog import load_parameter_catalog, invalidate_parameter_catalog
+from component.delta_store import get_parameter_store, apply_mutation
 from dotenv import load_dotenv
 import os
 
@@ -10,25 +12,17 @@ PARAM_API = f"{API_BASE_URL}/parameter"
 
 st.title("Edit Parameter Values")
 
-with st.spinner("Fetching parameters..."):
-    response = requests.get(PARAM_API)
-    if response.status_code != 200:
-        st.error("Failed to fetch parameters.")
-        st.stop()
-
-data = response.json()
-
-# Lookup parent names
-id_to_name = {p["id"]: p["name"] for p in data}
-used_as_parent = {p.get("parent_id") for p in data if p.get("parent_id") is not None}
-leaf_params = [p for p in data if p["id"] not in used_as_parent]
+catalog = load_parameter_catalog()
+if not catalog.parameters:
+    st.error("Failed to fetch parameters.")
+    st.stop()
 
 # Build selectbox
 display_names = []
 param_lookup = {}
 
-for p in leaf_params:
-    parent_name = id_to_name.get(p.get("parent_id"), "")
+for p in catalog.leaves:
+    parent_name = catalog.name_of(p.get("parent_id"))
     display_name = f"{p['name']} ({parent_name})" if parent_name else p['name']
     display_names.append(display_name)
     param_lookup[display_name] = p
@@ -83,9 +77,12 @@ if submit:
             "apha_24th_edition_method": apha_input.strip() if apha_input.strip() else None
         }
 
-        res = requests.put(f"{PARAM_API}/{selected_param['id']}", json=payload)
+        res = api_client.put(f"{PARAM_API}/{selected_param['id']}", json=payload)
 
-        if res.status_code == 200:
+        # Upserted into the snapshot so the rerun shows the new values before the store reconciles
+        record = {key: value for key, value in payload.items() if key != "parameter_id"}
+        if apply_mutation(get_parameter_store(), res, record={"id": selected_param["id"], **record}):
+            invalidate_parameter_catalog()
             st.success("Parameter values updated successfully.")
             st.rerun()
         else:
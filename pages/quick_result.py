@@ -1,5 +1,8 @@
 import streamlit as st
 import requests
+from component import api_client
+from component.async_fetch import fetch_json
+from component.parameter_catalog import load_parameter_catalog
 import pandas as pd
 from io import BytesIO
 import os
@@ -29,12 +32,7 @@ main_col, side_col = st.columns([4, 2], gap="large")
 
 with main_col:
     search = st.text_input("🔍 Search Parameter")
-    try:
-        all_params = requests.get(f"{BASE_API}/parameter").json()
-        filtered = [p for p in all_params if search.lower() in p["name"].lower()] if search else all_params
-    except:
-        st.error("❌ Cannot load parameters")
-        filtered = []
+    filtered = load_parameter_catalog().search(search)
 
     st.markdown("### ✅ Select Parameters to Enter Result")
     with st.container(height=400):
@@ -101,7 +99,7 @@ with main_col:
                 }
 
                 try:
-                    res = requests.post(f"{BASE_API}/quick_result/re", json=payload)
+                    res = api_client.post(f"{BASE_API}/quick_result/re", json=payload)
                     if res.status_code == 200:
                         st.success(f"✅ Saved: {param['name']}")
                         store_protocol = final_protocol
@@ -180,9 +178,8 @@ with side_col:
     if st.session_state.show_history:
         st.markdown("## 📚 Filter History")
         try:
-            res = requests.get(f"{BASE_API}/quick_result/")
-            res.raise_for_status()
-            df_hist = pd.DataFrame(res.json())
+            # Coalesced with other sessions' identical requests; dropped if this rerun is superseded
+            df_hist = pd.DataFrame(fetch_json("/quick_result/"))
 
             if df_hist.empty:
                 st.info("ℹ️ No records available.")
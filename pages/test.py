@@ -1,6 +1,7 @@
 import streamlit as st
-from pages.Customer_request import customer_id,customer,fetch_parameters,render_parameters,render_filtered_parameters,QUOTATION_API
-import requests
+from component.parameter_catalog import load_parameter_catalog
+from component.customer_requests import fetch_customers_with_orders,render_parameters,render_filtered_parameters,QUOTATION_API
+from component import api_client
 
 def handle_send_quotation(customer_id):
     if not st.session_state.selected_parameters:
@@ -16,7 +17,7 @@ def handle_send_quotation(customer_id):
         "total": total,
     }
 
-    response =  requests.post(f"{QUOTATION_API}", json=quotation_data)
+    response =  api_client.post(f"{QUOTATION_API}", json=quotation_data)
 
     if response.status_code == 200:
         st.success("Quotation sent successfully!")
@@ -26,9 +27,17 @@ def handle_send_quotation(customer_id):
     else:
         st.error("Failed to send quotation.")
 
+# Initialize session state variables
+if "selected_customer_id" not in st.session_state:
+    st.session_state.selected_customer_id = None
+if "selected_parameters" not in st.session_state:
+    st.session_state.selected_parameters = {}
+
+customer_id = st.session_state.selected_customer_id
+customer = next((c for c in fetch_customers_with_orders() if c.get("id") == customer_id), None)
 
 # ✅ Show Quotation form directly inside expander if selected
-if st.session_state.selected_customer_id == customer_id:
+if customer:
     st.markdown("### 🧾 Add Quotation")
 
     col1, col2, col3 = st.columns([2, 3, 2])
@@ -42,15 +51,7 @@ if st.session_state.selected_customer_id == customer_id:
         st.write(f"document: {customer['order_req_doc']}")
 
     selected_parameters = {}
-    parameters = fetch_parameters()
-    # Split parent and child parameters
-    parent_parameters = [p for p in parameters if p["price"] is None]
-    # Create child mapping by parent_id
-    child_map = {}
-    for p in parameters:
-        parent_id = p.get("parent_id")
-        if parent_id is not None:
-            child_map.setdefault(parent_id, []).append(p)
+    parent_parameters = [p for p in load_parameter_catalog().children.get(None, []) if p["price"] is None]
 
     with col2:
         st.subheader("📌 Select Parameters")
@@ -63,7 +64,7 @@ if st.session_state.selected_customer_id == customer_id:
                         st.markdown(f"### {parent['name']}")
                         render_parameters(parent["id"])
             else:
-                render_filtered_parameters()
+                render_filtered_parameters(search_term)
 
     # RIGHT COLUMN
     with col3: